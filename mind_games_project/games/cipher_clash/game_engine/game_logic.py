@@ -7,9 +7,26 @@ import pygame
 from mind_games_project.games.cipher_clash.config import DIFFICULTY_LEVELS, CIPHER_TYPES
 from mind_games_project.games.cipher_clash.game_engine.question_generator import QuestionGenerator
 
+class SoundRegistry:
+    """Sound effects and music tracks shared by every GameState instance."""
+    
+    # Populated once at startup by the game's load_sounds
+    sounds = {}
+    music_tracks = {}
+
 class GameState:
     """Manages the game state for Cipher Clash."""
     
+    __slots__ = (
+        "difficulty", "selected_cipher_type", "game_mode",
+        "current_question", "questions_answered", "correct_answers",
+        "total_score", "current_input", "game_active", "game_over",
+        "start_time", "elapsed_time", "time_limit",
+        "hints_available", "hint_revealed",
+        "sounds", "music_tracks", "current_music",
+        "question_generator", "_results"
+    )
+    
     def __init__(self):
         """Initialize the game state."""
         # Game settings
@@ -25,6 +42,7 @@ class GameState:
         self.current_input = ""
         self.game_active = False
         self.game_over = False
+        self._results = None
         
         # Timer
         self.start_time = 0
@@ -35,9 +53,9 @@ class GameState:
         self.hints_available = DIFFICULTY_LEVELS["medium"]["hint_count"]
         self.hint_revealed = False
         
-        # Sound effects and music
-        self.sounds = {}
-        self.music_tracks = {}
+        # Sound effects and music (bound to the shared registry, not copied)
+        self.sounds = SoundRegistry.sounds
+        self.music_tracks = SoundRegistry.music_tracks
         self.current_music = None
         
         # Question generator
@@ -62,6 +80,7 @@ class GameState:
         self.current_input = ""
         self.game_active = True
         self.game_over = False
+        self._results = None
         
         # Reset timer
         self.time_limit = DIFFICULTY_LEVELS[difficulty]["time_limit"]
@@ -151,6 +170,10 @@ class GameState:
         """End the current game."""
         self.game_active = False
         self.game_over = True
+        
+        # Freeze the results so result screens don't rebuild them every frame
+        self._results = self._compute_results()
+        
         self.play_sound("game_over")
         self.play_music("victory")
     
@@ -190,9 +213,17 @@ class GameState:
         """
         Get the game results.
         
+        Once the game has ended, the same cached dict is returned on every call.
+        
         Returns:
             dict: The game results
         """
+        if self._results is not None:
+            return self._results
+        return self._compute_results()
+    
+    def _compute_results(self):
+        """Build the results dict from the current game progress."""
         return {
             "total_score": self.total_score,
             "questions_answered": self.questions_answered,
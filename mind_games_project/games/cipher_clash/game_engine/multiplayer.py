@@ -6,6 +6,8 @@ Handles local multiplayer functionality.
 class MultiplayerManager:
     """Manages multiplayer functionality for Cipher Clash."""
     
+    __slots__ = ("player1_state", "player2_state", "current_turn", "game_active", "winner", "_results")
+    
     def __init__(self):
         """Initialize the multiplayer manager."""
         self.player1_state = None
@@ -13,6 +15,7 @@ class MultiplayerManager:
         self.current_turn = 1  # 1 for player 1, 2 for player 2
         self.game_active = False
         self.winner = None
+        self._results = None
     
     def start_multiplayer_game(self, player1_state, player2_state=None):
         """
@@ -27,6 +30,7 @@ class MultiplayerManager:
         self.current_turn = 1
         self.game_active = True
         self.winner = None
+        self._results = None
         
         # Initialize both players with the same question
         question = self.player1_state.question_generator.generate_question(
@@ -133,14 +137,14 @@ class MultiplayerManager:
                 self.winner = 1
             else:
                 # Compare scores
-                if self.player1_state.total_score > self.player2_state.total_score:
-                    self.winner = 1
-                elif self.player2_state.total_score > self.player1_state.total_score:
-                    self.winner = 2
+                p1_score = self.player1_state.total_score
+                p2_score = self.player2_state.total_score
+                if p1_score != p2_score:
+                    self.winner = 1 if p1_score > p2_score else 2
                 else:
                     # Tie - compare accuracy
-                    p1_accuracy = self.player1_state.correct_answers / max(1, self.player1_state.questions_answered)
-                    p2_accuracy = self.player2_state.correct_answers / max(1, self.player2_state.questions_answered)
+                    p1_accuracy = self.player1_state.get_results()["accuracy"]
+                    p2_accuracy = self.player2_state.get_results()["accuracy"]
                     
                     if p1_accuracy > p2_accuracy:
                         self.winner = 1
@@ -150,6 +154,8 @@ class MultiplayerManager:
                         # Still tied - it's a draw
                         self.winner = 0  # 0 indicates a draw
         
+        self._results = self._compute_results()
+        
         # Play victory music
         self.player1_state.play_music("victory")
     
@@ -157,9 +163,17 @@ class MultiplayerManager:
         """
         Get the multiplayer game results.
         
+        Once the game has ended, the same cached dict is returned on every call.
+        
         Returns:
             dict: The game results
         """
+        if self._results is not None:
+            return self._results
+        return self._compute_results()
+    
+    def _compute_results(self):
+        """Build the results dict from both players' current state."""
         results = {
             "winner": self.winner,
             "player1": self.player1_state.get_results() if self.player1_state else None,
@@ -3,17 +3,41 @@ Question Generator module for Cipher Clash.
 Generates random cipher puzzles of varying difficulty.
 """
 import random
+import string
 import json
 import os
 from mind_games_project.games.cipher_clash.config import DATA_DIR, CIPHER_TYPES, DIFFICULTY_LEVELS
 from mind_games_project.games.cipher_clash.game_engine.cipher_manager import CipherManager
 
+def _caesar_params(rng, complexity):
+    """For Caesar cipher, higher complexity means larger shifts."""
+    if complexity < 0.5:
+        return {"shift": rng.randint(1, 10)}
+    return {"shift": rng.randint(11, 25)}
+
+def _vigenere_params(rng, complexity):
+    """For Vigenère cipher, higher complexity means longer keys."""
+    key_length = int(3 + complexity * 5)  # 3-8 characters
+    return {"key": ''.join(rng.choices(string.ascii_lowercase, k=key_length))}
+
+def _no_params(rng, complexity):
+    """Ciphers that generate their own key need no extra parameters."""
+    return {}
+
+# Encryption parameter builders, keyed by cipher type
+_PARAM_BUILDERS = {
+    "caesar": _caesar_params,
+    "vigenere": _vigenere_params
+}
+
 class QuestionGenerator:
     """Generates cipher puzzles for the game."""
     
     def __init__(self):
         """Initialize the question generator."""
         self.cipher_manager = CipherManager()
+        # Private generator so question picks don't contend on the global random state
+        self._rng = random.Random()
         self.phrases_file = os.path.join(DATA_DIR, "phrases.json")
         self.phrases = self._load_phrases()
     
@@ -74,6 +98,8 @@ class QuestionGenerator:
                 - hint: A hint for solving the puzzle
                 - difficulty: The difficulty level
         """
+        choice = self._rng.choice
+        
         # Validate difficulty
         if difficulty not in DIFFICULTY_LEVELS:
             difficulty = "medium"
@@ -81,28 +107,17 @@ class QuestionGenerator:
         # Select a random cipher type if not specified
         if cipher_type is None or cipher_type not in CIPHER_TYPES:
             available_ciphers = list(CIPHER_TYPES.keys())
-            cipher_type = random.choice(available_ciphers)
+            cipher_type = choice(available_ciphers)
         
         # Select a random phrase based on difficulty
         phrases = self.phrases.get(difficulty, self.phrases["medium"])
-        original_text = random.choice(phrases)
+        original_text = choice(phrases)
         
         # Apply complexity adjustments based on difficulty
         complexity = DIFFICULTY_LEVELS[difficulty]["cipher_complexity"]
         
         # Generate encryption parameters based on complexity
-        params = {}
-        if cipher_type == "caesar":
-            # For Caesar cipher, higher complexity means larger shifts
-            if complexity < 0.5:
-                params["shift"] = random.randint(1, 10)
-            else:
-                params["shift"] = random.randint(11, 25)
-        
-        elif cipher_type == "vigenere":
-            # For Vigenère cipher, higher complexity means longer keys
-            key_length = int(3 + complexity * 5)  # 3-8 characters
-            params["key"] = ''.join(random.choice('abcdefghijklmnopqrstuvwxyz') for _ in range(key_length))
+        params = _PARAM_BUILDERS.get(cipher_type, _no_params)(self._rng, complexity)
         
         # Encrypt the text
         encrypted_text, key, hint = self.cipher_manager.encrypt(original_text, cipher_type, **params)
@@ -154,6 +169,10 @@ class QuestionGenerator:
         Calculate the similarity between two strings.
         Uses a simple ratio of matching characters.
         
+        When the lengths differ too much for the answer to pass (below 0.8),
+        the length ratio is returned as an upper bound without comparing
+        any characters.
+        
         Args:
             str1 (str): First string
             str2 (str): Second string
@@ -169,10 +188,16 @@ class QuestionGenerator:
         if len(str1) < len(str2):
             str1, str2 = str2, str1
         
+        # Matches can never exceed the shorter length, so a large length gap
+        # already rules the answer out
+        length_ratio = len(str2) / len(str1)
+        if length_ratio < 0.8:
+            return length_ratio
+        
         # Count matching characters
-        matches = sum(c1 == c2 for c1, c2 in zip(str1[:len(str2)], str2))
+        matches = sum(c1 == c2 for c1, c2 in zip(str1, str2))
         
         # Calculate similarity ratio
-        similarity = matches / max(len(str1), len(str2))
+        similarity = matches / len(str1)
         
         return similarity
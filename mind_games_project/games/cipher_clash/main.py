@@ -2,18 +2,15 @@
 Main entry point for the Cipher Clash game.
 """
 import os
-import sys
 import pygame
-from pygame.locals import *
+from pygame.locals import QUIT, KEYDOWN, K_ESCAPE
 
-# Add the parent directory to sys.path to allow importing shared modules
-parent_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-if parent_dir not in sys.path:
-    sys.path.append(parent_dir)
-
-from mind_games_project.games.cipher_clash.config import *
+from mind_games_project.games.cipher_clash.config import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, GAME_TITLE, GAME_VERSION, FPS,
+    FONTS_DIR, SOUNDS_DIR, FONT_SIZE_MEDIUM, SOUND_EFFECTS, MUSIC_TRACKS
+)
 from mind_games_project.games.cipher_clash.ui.screens import MenuScreen, GameScreen, ResultScreen
-from mind_games_project.games.cipher_clash.game_engine.game_logic import GameState
+from mind_games_project.games.cipher_clash.game_engine.game_logic import GameState, SoundRegistry
 
 class CipherClashGame:
     """Main game class for Cipher Clash."""
@@ -68,7 +65,7 @@ class CipherClashGame:
             print("Using system fonts instead.")
     
     def load_sounds(self):
-        """Load game sounds."""
+        """Load game sounds into the registry shared by all game states."""
         try:
             pygame.mixer.init()
             
@@ -76,13 +73,13 @@ class CipherClashGame:
             for sound_name, sound_file in SOUND_EFFECTS.items():
                 sound_path = os.path.join(SOUNDS_DIR, sound_file)
                 if os.path.exists(sound_path):
-                    self.game_state.sounds[sound_name] = pygame.mixer.Sound(sound_path)
+                    SoundRegistry.sounds[sound_name] = pygame.mixer.Sound(sound_path)
             
             # Load music tracks if they exist
             for track_name, track_file in MUSIC_TRACKS.items():
                 track_path = os.path.join(SOUNDS_DIR, track_file)
                 if os.path.exists(track_path):
-                    self.game_state.music_tracks[track_name] = track_path
+                    SoundRegistry.music_tracks[track_name] = track_path
                     
         except Exception as e:
             print(f"Error loading sounds: {e}")
@@ -7,12 +7,52 @@ import os
 import time
 import random
 import sys
+import numpy as np
+from mind_games_project.games.cipher_clash.modules.font_manager import ANSI_SUPPORTED
+
+# ANSI escapes: move the cursor to the top-left, and erase the display
+CURSOR_HOME = "\x1b[H"
+CLEAR_SCREEN = CURSOR_HOME + "\x1b[2J"
 
 def clear_screen():
     """Clear the terminal screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    # Writing the escape directly avoids spawning a shell for 'clear'; only
+    # consoles without ANSI support still need 'cls'
+    if ANSI_SUPPORTED:
+        sys.stdout.write(CLEAR_SCREEN)
+        sys.stdout.flush()
+    else:
+        os.system('cls')
+
+def write_frame(frame):
+    """
+    Write a complete animation frame to the terminal in one write.
+    
+    Args:
+        frame (str): The full frame, including any escape sequences
+    """
+    # Flush queued text first so the binary write lands after it
+    sys.stdout.flush()
+    stream = getattr(sys.stdout, "buffer", None)
+    if stream is None:
+        sys.stdout.write(frame)
+        sys.stdout.flush()
+        return
+    stream.write(frame.encode(sys.stdout.encoding or "utf-8", "replace"))
+    stream.flush()
+
+# ANSI color codes
+COLORS = {
+    "green": "\033[92m",
+    "red": "\033[91m",
+    "blue": "\033[94m",
+    "cyan": "\033[96m",
+    "yellow": "\033[93m",
+    "magenta": "\033[95m",
+    "reset": "\033[0m"
+}
 
-def typing_effect(text, speed=0.05, flicker_chance=0.1, color="green"):
+def typing_effect(text, speed=0.05, flicker_chance=0.1, color="green", chunk_size=1):
     """
     Display text with a typing effect and random flickering.
     
@@ -21,40 +61,49 @@ def typing_effect(text, speed=0.05, flicker_chance=0.1, color="green"):
         speed (float): Typing speed (seconds per character)
         flicker_chance (float): Probability of flickering (0.0 to 1.0)
         color (str): Text color ("green", "red", "blue", "cyan", "yellow", "magenta")
+        chunk_size (int): Characters written per flush; with larger chunks
+            only the last character of each chunk can flicker
     """
-    # ANSI color codes
-    colors = {
-        "green": "\033[92m",
-        "red": "\033[91m",
-        "blue": "\033[94m",
-        "cyan": "\033[96m",
-        "yellow": "\033[93m",
-        "magenta": "\033[95m",
-        "reset": "\033[0m"
-    }
-    
     # Use the selected color or default to green
-    color_code = colors.get(color.lower(), colors["green"])
+    color_code = COLORS.get(color.lower(), COLORS["green"])
+    reset = COLORS["reset"]
+    chunk_size = max(1, chunk_size)
     
-    # Type out each character with potential flicker
-    for char in text:
-        # Print the character with color
-        sys.stdout.write(f"{color_code}{char}{colors['reset']}")
-        sys.stdout.flush()
+    # Write pre-encoded bytes straight to the binary buffer when there is one,
+    # after flushing any text already queued so the output stays in order
+    sys.stdout.flush()
+    stream = getattr(sys.stdout, "buffer", sys.stdout)
+    encoding = sys.stdout.encoding or "utf-8"
+    if stream is sys.stdout:
+        encode = str
+        blank = "\b "
+        back = "\b"
+    else:
+        encode = lambda s: s.encode(encoding, "replace")
+        blank = b"\b "
+        back = b"\b"
+    write = stream.write
+    flush = stream.flush
+    
+    # Type out the text a chunk at a time with potential flicker
+    for start in range(0, len(text), chunk_size):
+        chunk = text[start:start + chunk_size]
+        write(encode(f"{color_code}{chunk}{reset}"))
+        flush()
         
         # Random delay to simulate variable typing speed
-        char_delay = speed * random.uniform(0.5, 1.5)
-        time.sleep(char_delay)
+        chunk_delay = speed * len(chunk) * random.uniform(0.5, 1.5)
+        time.sleep(chunk_delay)
         
         # Random flicker effect
         if random.random() < flicker_chance:
             # Briefly turn off the last character
-            sys.stdout.write("\b ")
-            sys.stdout.flush()
+            write(blank)
+            flush()
             time.sleep(0.05)
             # Turn it back on
-            sys.stdout.write(f"\b{color_code}{char}{colors['reset']}")
-            sys.stdout.flush()
+            write(back + encode(f"{color_code}{chunk[-1]}{reset}"))
+            flush()
             time.sleep(0.05)
 
 def title_animation():
@@ -94,6 +143,31 @@ def title_animation():
     print("\n")
     time.sleep(1)
 
+# Width that the countdown and result animations are centered in
+ANIMATION_WIDTH = 60
+
+# Result animation frames, centered once at import
+SUCCESS_FRAMES = tuple(frame.center(ANIMATION_WIDTH) for frame in ("  ✓  ", " ✓✓✓ ", "✓✓✓✓✓"))
+SUCCESS_MESSAGE = "DECRYPTED!".center(ANIMATION_WIDTH)
+FAILURE_FRAMES = tuple(frame.center(ANIMATION_WIDTH) for frame in ("  ×  ", " ××× ", "×××××"))
+FAILURE_MESSAGE = "ENCRYPTION FAILED!".center(ANIMATION_WIDTH)
+GO_MESSAGE = "GO!".center(ANIMATION_WIDTH)
+
+def show_centered(text):
+    """
+    Clear the screen and show a centered line a few rows down, in one write.
+    
+    Args:
+        text (str): The pre-centered line to show
+    """
+    # Fold the clear into the frame when the terminal understands ANSI
+    if ANSI_SUPPORTED:
+        clear = CLEAR_SCREEN
+    else:
+        clear_screen()
+        clear = ""
+    write_frame(f"{clear}\n\n\n{text}\n")
+
 def countdown_animation(seconds=3):
     """
     Display a countdown animation.
@@ -101,71 +175,57 @@ def countdown_animation(seconds=3):
     Args:
         seconds (int): Number of seconds to count down from
     """
-    for i in range(seconds, 0, -1):
-        clear_screen()
-        print("\n\n")
-        print(f"{i}".center(60))
+    numbers = tuple(str(i).center(ANIMATION_WIDTH) for i in range(seconds, 0, -1))
+    for number in numbers:
+        show_centered(number)
         time.sleep(1)
     
-    clear_screen()
-    print("\n\n")
-    print("GO!".center(60))
+    show_centered(GO_MESSAGE)
     time.sleep(0.5)
 
 def success_animation():
     """Display an animation for successfully solving a cipher."""
-    # Define the success message frames
-    frames = [
-        "  ✓  ",
-        " ✓✓✓ ",
-        "✓✓✓✓✓"
-    ]
-    
     # Display each frame
-    for frame in frames:
-        clear_screen()
-        print("\n\n")
-        print(frame.center(60))
+    for frame in SUCCESS_FRAMES:
+        show_centered(frame)
         time.sleep(0.2)
     
     # Display success message
-    clear_screen()
-    print("\n\n")
-    print("DECRYPTED!".center(60))
+    show_centered(SUCCESS_MESSAGE)
     time.sleep(1)
 
 def failure_animation():
     """Display an animation for failing to solve a cipher."""
-    # Define the failure message frames
-    frames = [
-        "  ×  ",
-        " ××× ",
-        "×××××"
-    ]
-    
     # Display each frame
-    for frame in frames:
-        clear_screen()
-        print("\n\n")
-        print(frame.center(60))
+    for frame in FAILURE_FRAMES:
+        show_centered(frame)
         time.sleep(0.2)
     
     # Display failure message
-    clear_screen()
-    print("\n\n")
-    print("ENCRYPTION FAILED!".center(60))
+    show_centered(FAILURE_MESSAGE)
     time.sleep(1)
 
-def matrix_rain(duration=3, density=0.2):
+# Column stride for each matrix_rain performance preset; lower presets
+# only draw every other or every third column
+MATRIX_RAIN_STRIDES = {
+    "ultra": 1,
+    "high": 2,
+    "medium": 3
+}
+
+def matrix_rain(duration=3, density=0.2, performance="ultra"):
     """
     Display a Matrix-style digital rain animation.
     
     Args:
         duration (float): Duration in seconds
         density (float): Character density (0.0 to 1.0)
+        performance (str): Quality preset ("ultra", "high", "medium");
+            lower presets leave columns blank to draw fewer characters
     """
-    width = os.get_terminal_size().columns
-    height = os.get_terminal_size().lines
+    stride = MATRIX_RAIN_STRIDES.get(performance, 1)
+    size = os.get_terminal_size()
+    width, height = size.columns, size.lines
     
     # Matrix characters (katakana and other symbols)
     chars = "ｱｲｳｴｵｶｷｸｹｺｻｼｽｾｿﾀﾁﾂﾃﾄﾅﾆﾇﾈﾉﾊﾋﾌﾍﾎﾏﾐﾑﾒﾓﾔﾕﾖﾗﾘﾙﾚﾛﾜﾝ1234567890!@#$%^&*()_+-=[]{}|;':,./<>?"
@@ -175,27 +235,82 @@ def matrix_rain(duration=3, density=0.2):
     bright_green = "\033[1;92m"
     reset = "\033[0m"
     
+    # Every glyph already wrapped in its color: normal green in the first
+    # half of the table, bright green in the second
+    glyphs = np.array([f"{green}{c}{reset}" for c in chars] +
+                      [f"{bright_green}{c}{reset}" for c in chars])
+    
+    # Every glyph is equally likely; 30% of the lit cells are bright
+    num_chars = len(chars)
+    weights = np.concatenate([np.full(num_chars, 0.7 / num_chars), np.full(num_chars, 0.3 / num_chars)])
+    
+    rng = np.random.default_rng()
+    cell_dtype = glyphs.dtype
+    
+    def allocate_buffers():
+        """Allocate the per-frame arrays once for the current terminal size."""
+        shape = (height, width)
+        # Only the drawn columns get random samples; the mask stays False
+        # in the skipped ones
+        return (np.empty((height, len(range(0, width, stride)))), np.zeros(shape, dtype=bool),
+                np.full(shape, " ", dtype=cell_dtype), np.full(shape, " ", dtype=cell_dtype))
+    
+    # Random samples, the lit-cell mask and two frame buffers reused on every
+    # frame; the previous frame is kept so only changed cells need to be
+    # redrawn
+    rand, mask, screen, prev = allocate_buffers()
+    full_redraw = True
+    frame_count = 0
+    frame_interval = 0.1
     start_time = time.time()
+    end_time = start_time + duration
+    
+    # Frames are paced against a deadline rather than a fixed sleep, so slow
+    # frames don't stretch the animation past its duration
+    next_tick = start_time
     
-    while time.time() - start_time < duration:
-        # Create a screen buffer
-        screen = [[" " for _ in range(width)] for _ in range(height)]
+    while time.time() < end_time:
+        # Pick up terminal resizes every 10 frames
+        frame_count += 1
+        if frame_count % 10 == 0:
+            size = os.get_terminal_size()
+            if (size.columns, size.lines) != (width, height):
+                width, height = size.columns, size.lines
+                clear_screen()
+                rand, mask, screen, prev = allocate_buffers()
+                full_redraw = True
         
-        # Fill with random characters based on density
-        for y in range(height):
-            for x in range(width):
-                if random.random() < density:
-                    # Randomly choose between normal and bright green
-                    color = bright_green if random.random() < 0.3 else green
-                    screen[y][x] = f"{color}{random.choice(chars)}{reset}"
+        # One draw decides which cells are lit, a second picks the colored
+        # glyph for just those cells
+        np.less(rng.random(out=rand), density, out=mask[:, ::stride])
+        screen.fill(" ")
+        screen[mask] = rng.choice(glyphs, size=np.count_nonzero(mask), p=weights)
         
-        # Clear screen and display the buffer
-        clear_screen()
-        for row in screen:
-            print("".join(row))
+        changed_y, changed_x = np.nonzero(screen != prev)
+        if full_redraw or len(changed_y) > 0.5 * width * height:
+            # Most of the screen changed: move the cursor home and overwrite
+            # the whole frame in one write
+            frame = CURSOR_HOME + "\n".join("".join(row) for row in screen.tolist())
+        else:
+            # Position the cursor on each changed cell and redraw only that cell
+            frame = "".join(
+                f"\x1b[{y + 1};{x + 1}H{cell}"
+                for y, x, cell in zip(changed_y.tolist(), changed_x.tolist(), screen[changed_y, changed_x].tolist())
+            )
+        write_frame(frame)
+        full_redraw = False
+        
+        # Swap buffers: this frame becomes the one to diff against
+        screen, prev = prev, screen
         
-        # Short delay
-        time.sleep(0.1)
+        # Sleep until the next frame is due; if rendering has fallen more
+        # than half a second behind, drop the backlog instead of rushing
+        next_tick += frame_interval
+        slack = min(next_tick, end_time) - time.time()
+        if slack > 0:
+            time.sleep(slack)
+        elif slack < -0.5:
+            next_tick = time.time()
 
 if __name__ == "__main__":
     # Test the animations
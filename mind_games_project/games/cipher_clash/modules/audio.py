@@ -7,13 +7,13 @@ import os
 import time
 import threading
 import random
-from pygame import mixer
+import numpy as np
+from pygame import mixer, sndarray
 
 # Initialize the mixer
 mixer.init()
 
-# Audio channels
-CHANNEL_MUSIC = 0
+# Audio channels (music streams through mixer.music, not a channel)
 CHANNEL_SFX = 1
 CHANNEL_TICKING = 2
 CHANNEL_MORSE = 3
@@ -44,9 +44,11 @@ SOUND_FILES = {
     
     # Morse code sounds
     "morse_dot": "morse_dot.wav",
-    "morse_dash": "morse_dash.wav",
-    
-    # Music tracks
+    "morse_dash": "morse_dash.wav"
+}
+
+# Music tracks, streamed from disk rather than decoded into memory
+MUSIC_FILES = {
     "ambient_normal": "ambient_normal.mp3",
     "ambient_intense": "ambient_intense.mp3"
 }
@@ -62,250 +64,379 @@ MORSE_CODE = {
     '5': '.....', '6': '-....', '7': '--...', '8': '---..', '9': '----.'
 }
 
-# Sound objects
-sounds = {}
-current_music = None
-ticking_thread = None
-morse_thread = None
-is_running = False
-
-def init_audio():
-    """Initialize audio system and load sound files."""
-    global sounds
-    
-    # Create mixer channels
-    mixer.set_num_channels(8)
-    
-    # Check if audio directory exists
-    if not os.path.exists(AUDIO_DIR):
-        os.makedirs(AUDIO_DIR)
-        print(f"Created audio directory: {AUDIO_DIR}")
-        print("Note: You'll need to add sound files to this directory.")
-        return False
+class AudioManager:
+    """Owns the mixer channels, sounds and background playback state."""
+    
+    __slots__ = (
+        "sound_paths", "sound_cache", "music_paths", "current_music",
+        "sfx_chan", "tick_chan", "morse_chan",
+        "tick_table", "tick_stop", "ticking_thread"
+    )
+    
+    def __init__(self):
+        """Initialize an audio manager with no channels or sounds yet."""
+        # Sound files found by init_audio, and the sounds loaded from them so
+        # far; each file is only decoded the first time it is played or
+        # preloaded
+        self.sound_paths = {}
+        self.sound_cache = {}
+        self.music_paths = {}
+        self.current_music = None
+        
+        # Mixer channels, created once by init_audio
+        self.sfx_chan = None
+        self.tick_chan = None
+        self.morse_chan = None
+        
+        # Ticking phases as (sound, delay, volume), from relaxed to urgent;
+        # built by start_adaptive_ticking once the sound files are known
+        self.tick_table = None
+        
+        # Stop signal for the ticking thread, so it can be woken immediately
+        # from its wait
+        self.tick_stop = threading.Event()
+        self.ticking_thread = None
+    
+    def init_audio(self):
+        """Initialize audio system and locate sound files."""
+        # Create mixer channels and keep handles to them; fixed volumes are
+        # set here rather than on every play
+        mixer.set_num_channels(8)
+        mixer.music.set_volume(MUSIC_VOLUME)
+        self.sfx_chan = mixer.Channel(CHANNEL_SFX)
+        self.sfx_chan.set_volume(SFX_VOLUME)
+        self.tick_chan = mixer.Channel(CHANNEL_TICKING)
+        self.morse_chan = mixer.Channel(CHANNEL_MORSE)
+        self.morse_chan.set_volume(MORSE_VOLUME)
+        
+        # Check if audio directory exists
+        if not os.path.exists(AUDIO_DIR):
+            os.makedirs(AUDIO_DIR)
+            print(f"Created audio directory: {AUDIO_DIR}")
+            print("Note: You'll need to add sound files to this directory.")
+            return False
+        
+        # Record available sound files; they are loaded on first use
+        for sound_name, filename in SOUND_FILES.items():
+            file_path = os.path.join(AUDIO_DIR, filename)
+            if os.path.exists(file_path):
+                self.sound_paths[sound_name] = file_path
+            else:
+                print(f"Sound file not found: {file_path}")
+        
+        for music_name, filename in MUSIC_FILES.items():
+            file_path = os.path.join(AUDIO_DIR, filename)
+            if os.path.exists(file_path):
+                self.music_paths[music_name] = file_path
+            else:
+                print(f"Music file not found: {file_path}")
+        
+        return len(self.sound_paths) + len(self.music_paths) > 0
     
-    # Load available sound files
-    for sound_name, filename in SOUND_FILES.items():
-        file_path = os.path.join(AUDIO_DIR, filename)
-        if os.path.exists(file_path):
+    def get_sound(self, sound_name):
+        """
+        Get a sound, loading it from disk the first time it is needed.
+        
+        Args:
+            sound_name (str): Name of the sound
+            
+        Returns:
+            pygame.mixer.Sound: The sound, or None if it is not available
+        """
+        sound = self.sound_cache.get(sound_name)
+        if sound is None and sound_name in self.sound_paths:
             try:
-                sounds[sound_name] = mixer.Sound(file_path)
-                print(f"Loaded sound: {sound_name}")
+                sound = self.sound_cache[sound_name] = mixer.Sound(self.sound_paths[sound_name])
             except Exception as e:
                 print(f"Error loading sound {sound_name}: {e}")
-        else:
-            print(f"Sound file not found: {file_path}")
-    
-    return len(sounds) > 0
-
-def play_sound(sound_name):
-    """
-    Play a sound effect once.
-    
-    Args:
-        sound_name (str): Name of the sound to play
-    """
-    if sound_name in sounds:
-        channel = mixer.Channel(CHANNEL_SFX)
-        channel.set_volume(SFX_VOLUME)
-        channel.play(sounds[sound_name])
-
-def play_music(music_name, loop=True):
-    """
-    Play background music.
-    
-    Args:
-        music_name (str): Name of the music track to play
-        loop (bool): Whether to loop the music
-    """
-    global current_music
-    
-    if music_name in sounds:
-        channel = mixer.Channel(CHANNEL_MUSIC)
-        channel.set_volume(MUSIC_VOLUME)
-        channel.play(sounds[music_name], loops=-1 if loop else 0)
-        current_music = music_name
-
-def stop_music():
-    """Stop the currently playing music."""
-    mixer.Channel(CHANNEL_MUSIC).stop()
-    global current_music
-    current_music = None
-
-def play_morse_code(text, speed=0.1):
-    """
-    Play text as Morse code.
-    
-    Args:
-        text (str): Text to convert to Morse code
-        speed (float): Speed factor (lower is faster)
-    """
-    if 'morse_dot' not in sounds or 'morse_dash' not in sounds:
-        return
-    
-    text = text.upper()
-    morse_sequence = []
-    
-    # Convert text to Morse code sequence
-    for char in text:
-        if char in MORSE_CODE:
-            for symbol in MORSE_CODE[char]:
-                morse_sequence.append(symbol)
-            morse_sequence.append(' ')  # Space between letters
-    
-    # Play the Morse code
-    channel = mixer.Channel(CHANNEL_MORSE)
-    channel.set_volume(MORSE_VOLUME)
-    
-    for symbol in morse_sequence:
-        if symbol == '.':
-            channel.play(sounds['morse_dot'])
-            time.sleep(speed)
-        elif symbol == '-':
-            channel.play(sounds['morse_dash'])
-            time.sleep(speed * 3)
-        elif symbol == ' ':
-            time.sleep(speed * 3)  # Space between letters
-
-def morse_code_thread(message, speed=0.1):
-    """
-    Thread function to play Morse code in the background.
-    
-    Args:
-        message (str): Message to play as Morse code
-        speed (float): Speed factor
-    """
-    global is_running
-    
-    while is_running:
-        play_morse_code(message, speed)
-        time.sleep(2)  # Pause between repetitions
-
-def start_morse_code_background(message, speed=0.1):
-    """
-    Start playing Morse code in the background.
-    
-    Args:
-        message (str): Message to play as Morse code
-        speed (float): Speed factor
-    """
-    global morse_thread, is_running
-    
-    if morse_thread is not None and morse_thread.is_alive():
-        stop_morse_code()
-    
-    is_running = True
-    morse_thread = threading.Thread(target=morse_code_thread, args=(message, speed))
-    morse_thread.daemon = True
-    morse_thread.start()
-
-def stop_morse_code():
-    """Stop the background Morse code."""
-    global is_running
-    is_running = False
-    mixer.Channel(CHANNEL_MORSE).stop()
-
-def adaptive_ticking(time_remaining, time_limit):
-    """
-    Play ticking sounds that adapt to remaining time.
-    
-    Args:
-        time_remaining (float): Remaining time in seconds
-        time_limit (float): Total time limit in seconds
-    """
-    # Calculate time percentage
-    time_percent = time_remaining / time_limit
-    
-    # Select appropriate ticking sound based on time remaining
-    if time_percent > 0.5:
-        tick_sound = 'tick_normal'
-        delay = 1.0  # Normal ticking (once per second)
-    elif time_percent > 0.25:
-        tick_sound = 'tick_normal'
-        delay = 0.5  # Faster ticking (twice per second)
-    else:
-        tick_sound = 'tick_urgent'
-        delay = 0.25  # Urgent ticking (four times per second)
+                # Don't retry a file that failed to decode
+                del self.sound_paths[sound_name]
+        return sound
     
-    # Adjust volume based on time remaining (gets louder as time runs out)
-    volume = TICKING_VOLUME * (1.0 + (1.0 - time_percent) * 0.5)
-    volume = min(1.0, volume)  # Cap at maximum volume
-    
-    # Play the tick if available
-    if tick_sound in sounds:
-        channel = mixer.Channel(CHANNEL_TICKING)
-        channel.set_volume(volume)
-        channel.play(sounds[tick_sound])
-    
-    return delay
-
-def ticking_thread_function(time_limit):
-    """
-    Thread function for adaptive ticking.
+    def preload(self, *sound_names):
+        """
+        Load sounds ahead of time so their first playback has no decode delay.
+        
+        Args:
+            *sound_names (str): Names of the sounds to load
+        """
+        for sound_name in sound_names:
+            self.get_sound(sound_name)
+    
+    def play_sound(self, sound_name):
+        """
+        Play a sound effect once.
+        
+        Args:
+            sound_name (str): Name of the sound to play
+        """
+        sound = self.get_sound(sound_name)
+        if sound is not None:
+            self.sfx_chan.play(sound)
+    
+    def play_music(self, music_name, loop=True):
+        """
+        Play background music.
+        
+        Args:
+            music_name (str): Name of the music track to play
+            loop (bool): Whether to loop the music
+        """
+        if music_name in self.music_paths:
+            try:
+                mixer.music.load(self.music_paths[music_name])
+                mixer.music.play(-1 if loop else 0)
+                self.current_music = music_name
+            except Exception as e:
+                print(f"Error playing music {music_name}: {e}")
     
-    Args:
-        time_limit (float): Total time limit in seconds
-    """
-    global is_running
-    start_time = time.time()
+    def stop_music(self):
+        """Stop the currently playing music."""
+        mixer.music.stop()
+        self.current_music = None
     
-    while is_running:
-        elapsed = time.time() - start_time
-        remaining = max(0, time_limit - elapsed)
+    def compile_morse(self, text, speed):
+        """
+        Convert text into a ready-to-play Morse sequence.
         
-        if remaining <= 0:
-            break
+        Args:
+            text (str): Text to convert to Morse code
+            speed (float): Speed factor (lower is faster)
             
-        delay = adaptive_ticking(remaining, time_limit)
-        time.sleep(delay)
-
-def start_adaptive_ticking(time_limit):
-    """
-    Start adaptive ticking based on time limit.
+        Returns:
+            list: (sound, delay) pairs; sound is None for the gap between letters
+        """
+        timing = {
+            '.': (self.get_sound('morse_dot'), speed),
+            '-': (self.get_sound('morse_dash'), speed * 3),
+            ' ': (None, speed * 3)  # Space between letters
+        }
+        symbols = "".join(MORSE_CODE[char] + " " for char in text.upper() if char in MORSE_CODE)
+        return [timing[symbol] for symbol in symbols]
+    
+    def render_morse(self, text, speed, pause=0.0):
+        """
+        Render text as a single Morse code sound.
+        
+        The dot and dash samples are spliced into one buffer at their
+        scheduled offsets, so the whole message plays natively in the mixer.
+        
+        Args:
+            text (str): Text to convert to Morse code
+            speed (float): Speed factor (lower is faster)
+            pause (float): Silence in seconds appended after the message
+            
+        Returns:
+            pygame.mixer.Sound: The rendered message, or None if the text has
+                no characters with a Morse code
+        """
+        sequence = self.compile_morse(text, speed)
+        if not sequence:
+            # An empty buffer can't be played
+            return None
+        
+        frequency = mixer.get_init()[0]
+        
+        # Each symbol occupies its delay; a sample longer than that is cut
+        # off, just as the next channel.play() would have cut it
+        slot_lengths = [int(delay * frequency) for _, delay in sequence]
+        template = sndarray.array(self.get_sound('morse_dot'))
+        rendered = np.zeros((sum(slot_lengths) + int(pause * frequency),) + template.shape[1:], dtype=template.dtype)
+        
+        samples = {}
+        offset = 0
+        for (sound, _), length in zip(sequence, slot_lengths):
+            if sound is not None:
+                if sound not in samples:
+                    samples[sound] = sndarray.array(sound)
+                clip = samples[sound][:length]
+                rendered[offset:offset + len(clip)] = clip
+            offset += length
+        
+        return sndarray.make_sound(rendered)
     
-    Args:
-        time_limit (float): Total time limit in seconds
-    """
-    global ticking_thread, is_running
+    def has_morse(self):
+        """
+        Check whether the Morse code sounds are available.
+        
+        Returns:
+            bool: True if both the dot and dash sounds loaded
+        """
+        return self.get_sound('morse_dot') is not None and self.get_sound('morse_dash') is not None
+    
+    def play_morse_code(self, text, speed=0.1):
+        """
+        Play text as Morse code.
+        
+        Args:
+            text (str): Text to convert to Morse code
+            speed (float): Speed factor (lower is faster)
+        """
+        if not self.has_morse():
+            return
+        
+        rendered = self.render_morse(text, speed)
+        if rendered is None:
+            return
+        
+        self.morse_chan.play(rendered)
+        time.sleep(rendered.get_length())
     
-    if ticking_thread is not None and ticking_thread.is_alive():
-        stop_adaptive_ticking()
+    def start_morse_code_background(self, message, speed=0.1):
+        """
+        Start playing Morse code in the background.
+        
+        Args:
+            message (str): Message to play as Morse code
+            speed (float): Speed factor
+        """
+        if not self.has_morse():
+            return
+        
+        # Render the message once, with the pause between repetitions, and
+        # let the mixer loop it
+        rendered = self.render_morse(message, speed, pause=2)
+        if rendered is not None:
+            self.morse_chan.play(rendered, loops=-1)
+    
+    def stop_morse_code(self):
+        """Stop the background Morse code."""
+        if self.morse_chan is not None:
+            self.morse_chan.stop()
+    
+    def build_tick_table(self):
+        """
+        Build the ticking phases for adaptive_ticking.
+        
+        Returns:
+            list: (sound, delay, volume) per phase; sound is None if not loaded
+        """
+        return [
+            # Normal ticking (once per second)
+            (self.get_sound('tick_normal'), 1.0, TICKING_VOLUME),
+            # Faster ticking (twice per second)
+            (self.get_sound('tick_normal'), 0.5, min(1.0, TICKING_VOLUME * 1.25)),
+            # Urgent ticking (four times per second), loudest
+            (self.get_sound('tick_urgent'), 0.25, min(1.0, TICKING_VOLUME * 1.5))
+        ]
+    
+    def adaptive_ticking(self, time_remaining, time_limit):
+        """
+        Play ticking sounds that adapt to remaining time.
+        
+        Args:
+            time_remaining (float): Remaining time in seconds
+            time_limit (float): Total time limit in seconds
+            
+        Returns:
+            float: Delay in seconds until the next tick
+        """
+        tick_table = self.tick_table
+        if tick_table is None:
+            tick_table = self.tick_table = self.build_tick_table()
+        
+        # Select the phase based on time remaining (faster and louder as time runs out)
+        time_percent = time_remaining / time_limit
+        phase = 0 if time_percent > 0.5 else 1 if time_percent > 0.25 else 2
+        tick_sound, delay, volume = tick_table[phase]
+        
+        # Play the tick if available
+        if tick_sound is not None:
+            tick_chan = self.tick_chan
+            tick_chan.set_volume(volume)
+            tick_chan.play(tick_sound)
+        
+        return delay
     
-    is_running = True
-    ticking_thread = threading.Thread(target=ticking_thread_function, args=(time_limit,))
-    ticking_thread.daemon = True
-    ticking_thread.start()
-
-def stop_adaptive_ticking():
-    """Stop the adaptive ticking."""
-    global is_running
-    is_running = False
-    mixer.Channel(CHANNEL_TICKING).stop()
+    def ticking_thread_function(self, time_limit):
+        """
+        Thread function for adaptive ticking.
+        
+        Args:
+            time_limit (float): Total time limit in seconds
+        """
+        tick_stop = self.tick_stop
+        adaptive_ticking = self.adaptive_ticking
+        start_time = time.time()
+        
+        while not tick_stop.is_set():
+            elapsed = time.time() - start_time
+            remaining = max(0, time_limit - elapsed)
+            
+            if remaining <= 0:
+                break
+                
+            delay = adaptive_ticking(remaining, time_limit)
+            if tick_stop.wait(delay):
+                break
+    
+    def start_adaptive_ticking(self, time_limit):
+        """
+        Start adaptive ticking based on time limit.
+        
+        Args:
+            time_limit (float): Total time limit in seconds
+        """
+        if self.ticking_thread is not None and self.ticking_thread.is_alive():
+            self.stop_adaptive_ticking()
+            self.ticking_thread.join()
+        
+        # Resolve the tick sounds and volumes once rather than on every tick
+        self.tick_table = self.build_tick_table()
+        
+        self.tick_stop.clear()
+        self.ticking_thread = threading.Thread(target=self.ticking_thread_function, args=(time_limit,))
+        self.ticking_thread.daemon = True
+        self.ticking_thread.start()
+    
+    def stop_adaptive_ticking(self):
+        """Stop the adaptive ticking."""
+        self.tick_stop.set()
+        if self.tick_chan is not None:
+            self.tick_chan.stop()
+    
+    def adapt_soundtrack(self, time_remaining, time_limit):
+        """
+        Adapt the soundtrack based on remaining time.
+        
+        Args:
+            time_remaining (float): Remaining time in seconds
+            time_limit (float): Total time limit in seconds
+        """
+        # Calculate time percentage
+        time_percent = time_remaining / time_limit
+        
+        # Switch music tracks based on time pressure
+        if time_percent < 0.3 and self.current_music != 'ambient_intense' and 'ambient_intense' in self.music_paths:
+            self.play_music('ambient_intense')
+        elif time_percent >= 0.3 and self.current_music != 'ambient_normal' and 'ambient_normal' in self.music_paths:
+            self.play_music('ambient_normal')
+    
+    def cleanup(self):
+        """Clean up audio resources."""
+        self.stop_adaptive_ticking()
+        self.stop_morse_code()
+        self.stop_music()
+        mixer.quit()
 
-def adapt_soundtrack(time_remaining, time_limit):
-    """
-    Adapt the soundtrack based on remaining time.
-    
-    Args:
-        time_remaining (float): Remaining time in seconds
-        time_limit (float): Total time limit in seconds
-    """
-    global current_music
-    
-    # Calculate time percentage
-    time_percent = time_remaining / time_limit
-    
-    # Switch music tracks based on time pressure
-    if time_percent < 0.3 and current_music != 'ambient_intense' and 'ambient_intense' in sounds:
-        play_music('ambient_intense')
-    elif time_percent >= 0.3 and current_music != 'ambient_normal' and 'ambient_normal' in sounds:
-        play_music('ambient_normal')
+# Shared audio manager behind the module-level functions
+audio_manager = AudioManager()
 
-def cleanup():
-    """Clean up audio resources."""
-    stop_adaptive_ticking()
-    stop_morse_code()
-    stop_music()
-    mixer.quit()
+# Module-level API, delegating to the shared manager
+init_audio = audio_manager.init_audio
+preload = audio_manager.preload
+play_sound = audio_manager.play_sound
+play_music = audio_manager.play_music
+stop_music = audio_manager.stop_music
+play_morse_code = audio_manager.play_morse_code
+start_morse_code_background = audio_manager.start_morse_code_background
+stop_morse_code = audio_manager.stop_morse_code
+adaptive_ticking = audio_manager.adaptive_ticking
+ticking_thread_function = audio_manager.ticking_thread_function
+start_adaptive_ticking = audio_manager.start_adaptive_ticking
+stop_adaptive_ticking = audio_manager.stop_adaptive_ticking
+adapt_soundtrack = audio_manager.adapt_soundtrack
+cleanup = audio_manager.cleanup
 
 # Test function
 def test_audio():
@@ -17,6 +17,9 @@ def supports_ansi():
         # Most Unix-like systems support ANSI
         return True
 
+# The terminal doesn't change while the game runs, so detect support once
+ANSI_SUPPORTED = bool(supports_ansi())
+
 # ANSI escape codes for text styling
 ANSI_RESET = "\033[0m"
 ANSI_BOLD = "\033[1m"
@@ -134,12 +137,58 @@ FONT_STYLES = {
     }
 }
 
+# Synchronized output (DEC mode 2026): the terminal holds redraws until the end
+SYNC_BEGIN = "\033[?2026h"
+SYNC_END = "\033[?2026l"
+
+def supports_sync_output():
+    """Check if output should be wrapped in synchronized-update codes."""
+    # Only a real terminal that handles escape codes gets them, not a pipe,
+    # a log file or a dumb terminal
+    return ANSI_SUPPORTED and sys.stdout.isatty() and os.environ.get("TERM", "") != "dumb"
+
+# Shared by every bulk write, so UI frames and banners always agree
+SYNC_OUTPUT = supports_sync_output()
+
+# Escape codes that open each style, built once from FONT_STYLES
+_STYLE_PREFIX = {
+    name: (ANSI_COLORS.get(style.get("color"), "")
+           + (ANSI_BOLD if style.get("bold", False) else "")
+           + (ANSI_BLINK if style.get("blink", False) else ""))
+    for name, style in FONT_STYLES.items()
+}
+
+# Stand-in prefixes for when styling is off
+_NO_PREFIX = dict.fromkeys(FONT_STYLES, "")
+
+def _make_styler(style_name):
+    """
+    Create a function that applies one style, with its prefix baked in.
+    
+    Args:
+        style_name (str): Name of the style to apply
+        
+    Returns:
+        function: Takes the text and whether styling is on, returns the text
+    """
+    prefix = _STYLE_PREFIX[style_name]
+    
+    def styler(text, styled):
+        return f"{prefix}{text}{ANSI_RESET}" if styled else text
+    
+    return styler
+
+# Stylers for each style, used by the format_* methods
+_STYLERS = {name: _make_styler(name) for name in FONT_STYLES}
+
 class FontManager:
     """Manages fonts and text styling for the game."""
     
+    __slots__ = ("ansi_supported", "use_styling")
+    
     def __init__(self):
         """Initialize the font manager."""
-        self.ansi_supported = supports_ansi()
+        self.ansi_supported = ANSI_SUPPORTED
         self.use_styling = True
         
     def toggle_styling(self):
@@ -158,30 +207,25 @@ class FontManager:
         Returns:
             str: The styled text
         """
-        if not self.ansi_supported or not self.use_styling:
-            return text
-            
-        if style_name not in FONT_STYLES:
+        prefix = _STYLE_PREFIX.get(style_name)
+        if prefix is None or not (self.ansi_supported and self.use_styling):
             return text
-            
-        style = FONT_STYLES[style_name]
-        result = ""
         
-        # Apply color
-        if "color" in style and style["color"] in ANSI_COLORS:
-            result += ANSI_COLORS[style["color"]]
-            
-        # Apply bold
-        if style.get("bold", False):
-            result += ANSI_BOLD
-            
-        # Apply blink
-        if style.get("blink", False):
-            result += ANSI_BLINK
-            
-        # Add the text and reset
-        result += text + ANSI_RESET
-        return result
+        return f"{prefix}{text}{ANSI_RESET}"
+        
+    def render_frame(self, *parts):
+        """
+        Write a whole frame to the terminal with a single write and flush.
+        
+        Args:
+            *parts (str): The styled pieces of the frame, in order
+        """
+        frame = "".join(parts)
+        if SYNC_OUTPUT:
+            frame = f"{SYNC_BEGIN}{frame}{SYNC_END}"
+        
+        sys.stdout.write(frame)
+        sys.stdout.flush()
         
     def format_cipher_text(self, cipher_text, cipher_type):
         """
@@ -194,11 +238,13 @@ class FontManager:
         Returns:
             str: The formatted text
         """
+        styled = self.ansi_supported and self.use_styling
+        
         # Style the cipher type
-        styled_type = self.style_text(cipher_type, "cipher_type")
+        styled_type = _STYLERS["cipher_type"](cipher_type, styled)
         
         # Style the cipher text
-        styled_text = self.style_text(cipher_text, "cipher_text")
+        styled_text = _STYLERS["cipher_text"](cipher_text, styled)
         
         return f"{styled_type}:\n{styled_text}"
         
@@ -216,24 +262,23 @@ class FontManager:
         Returns:
             str: The formatted stats
         """
-        # Style the score
-        styled_score = self.style_text(f"Score: {score}", "score")
-        
-        # Style the ciphers solved
-        styled_ciphers = self.style_text(f"Ciphers: {ciphers_solved}", "info")
+        if self.ansi_supported and self.use_styling:
+            prefix, reset = _STYLE_PREFIX, ANSI_RESET
+        else:
+            prefix, reset = _NO_PREFIX, ""
         
-        # Style the attempts
-        styled_attempts = self.style_text(f"Attempts: {attempts}", "info")
-        
-        # Style the time (changes color when low)
+        # The time changes color when low
         minutes = int(time_remaining // 60)
         seconds = int(time_remaining % 60)
-        time_text = f"Time: {minutes:02d}:{seconds:02d}"
-        
         time_style = "time_low" if time_remaining < (time_limit * 0.3) else "time"
-        styled_time = self.style_text(time_text, time_style)
         
-        return f"{styled_score}  |  {styled_ciphers}  |  {styled_attempts}  |  {styled_time}"
+        # Build the styled score, ciphers, attempts and time in one join
+        return "".join((
+            prefix["score"], f"Score: {score}", reset, "  |  ",
+            prefix["info"], f"Ciphers: {ciphers_solved}", reset, "  |  ",
+            prefix["info"], f"Attempts: {attempts}", reset, "  |  ",
+            prefix[time_style], f"Time: {minutes:02d}:{seconds:02d}", reset
+        ))
         
     def format_hint(self, hint_text, cost):
         """
@@ -246,11 +291,13 @@ class FontManager:
         Returns:
             str: The formatted hint
         """
+        styled = self.ansi_supported and self.use_styling
+        
         # Style the hint header
-        styled_header = self.style_text(f"HINT (Cost: {cost} points):", "hint")
+        styled_header = _STYLERS["hint"](f"HINT (Cost: {cost} points):", styled)
         
         # Style the hint text
-        styled_hint = self.style_text(hint_text, "info")
+        styled_hint = _STYLERS["info"](hint_text, styled)
         
         return f"{styled_header}\n{styled_hint}"
         
@@ -264,11 +311,13 @@ class FontManager:
         Returns:
             str: The formatted message
         """
+        styled = self.ansi_supported and self.use_styling
+        
         # Style the success header
-        styled_header = self.style_text("CORRECT!", "success")
+        styled_header = _STYLERS["success"]("CORRECT!", styled)
         
         # Style the points message
-        styled_points = self.style_text(f"You earned {points} points!", "score")
+        styled_points = _STYLERS["score"](f"You earned {points} points!", styled)
         
         return f"{styled_header}\n{styled_points}"
         
@@ -282,7 +331,7 @@ class FontManager:
         Returns:
             str: The formatted message
         """
-        return self.style_text(message, "error")
+        return _STYLERS["error"](message, self.ansi_supported and self.use_styling)
         
     def format_title(self, title):
         """
@@ -294,7 +343,7 @@ class FontManager:
         Returns:
             str: The formatted title
         """
-        return self.style_text(title, "title")
+        return _STYLERS["title"](title, self.ansi_supported and self.use_styling)
         
     def format_menu_option(self, option, selected=False):
         """
@@ -308,7 +357,7 @@ class FontManager:
             str: The formatted option
         """
         style = "menu_selected" if selected else "menu_option"
-        return self.style_text(option, style)
+        return _STYLERS[style](option, self.ansi_supported and self.use_styling)
         
     def format_input_prompt(self, prompt):
         """
@@ -320,7 +369,7 @@ class FontManager:
         Returns:
             str: The formatted prompt
         """
-        return self.style_text(prompt, "input_prompt")
+        return _STYLERS["input_prompt"](prompt, self.ansi_supported and self.use_styling)
 
 # Create a global instance
 font_manager = FontManager()
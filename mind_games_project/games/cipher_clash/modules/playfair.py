@@ -2,6 +2,9 @@
 Playfair cipher implementation for Cipher Clash game.
 """
 
+from functools import lru_cache
+import numpy as np
+
 def create_playfair_matrix(key):
     """
     Create a 5x5 Playfair cipher matrix from a key.
@@ -12,54 +15,116 @@ def create_playfair_matrix(key):
     Returns:
         list: 5x5 matrix of characters
     """
-    # Convert key to uppercase and remove duplicates while preserving order
-    key = key.upper()
-    key_chars = []
-    for char in key:
-        if char.isalpha() and char not in key_chars:
-            # Replace J with I in the Playfair cipher
-            if char == 'J':
-                char = 'I'
-            key_chars.append(char)
+    letters = _build_playfair_table(key)[0]
+    return [list(letters[i:i+5]) for i in range(0, 25, 5)]
+
+@lru_cache(maxsize=128)
+def _build_playfair_table(key):
+    """
+    Build the Playfair matrix and position lookup for a key, once per key.
+    
+    Args:
+        key (str): The key to use for the matrix
+        
+    Returns:
+        tuple: (letters, positions, cell_of, ascii_cells, matrix_codes) - the
+            matrix as one 25-character string read row by row, its lookup
+            from create_position_lookup, and the cell lookups and letter
+            codes used by transform_digraphs
+    """
+    # Convert key to uppercase, replace J with I in the Playfair cipher, and
+    # remove duplicates while preserving order (dicts keep insertion order)
+    key = key.upper().replace('J', 'I')
+    key_chars = list(dict.fromkeys(char for char in key if char.isalpha()))
     
     # Create the alphabet without duplicates from the key
     # and replacing J with I
-    alphabet = [c for c in "ABCDEFGHIKLMNOPQRSTUVWXYZ" if c not in key_chars]
+    used = set(key_chars)
+    alphabet = [c for c in "ABCDEFGHIKLMNOPQRSTUVWXYZ" if c not in used]
     
     # Combine key characters and remaining alphabet
     matrix_chars = key_chars + alphabet
     
-    # Create 5x5 matrix
-    matrix = []
-    for i in range(0, 25, 5):
-        matrix.append(matrix_chars[i:i+5])
+    # Lay the 5x5 matrix out flat, one row after another
+    letters = ''.join(matrix_chars[:25])
+    rows = [letters[i:i+5] for i in range(0, 25, 5)]
+    positions = create_position_lookup(rows)
+    
+    # Each letter's cell (row * 5 + col), as a dict and as a table indexed
+    # by ASCII code that covers both cases (-1 where there is no letter)
+    cell_of = {char: row * 5 + col for char, (row, col) in positions.items()}
+    ascii_cells = np.full(128, -1, dtype=np.int16)
+    for char, cell in cell_of.items():
+        if char.isascii():
+            ascii_cells[ord(char)] = ascii_cells[ord(char.lower())] = cell
+    
+    # The matrix letters as code points, indexed by cell
+    matrix_codes = np.frombuffer(letters.encode("utf-32-le"), dtype="<u4")
     
-    return matrix
+    # The arrays are shared by every call for this key, so keep them
+    # read-only (arrays from frombuffer already are)
+    ascii_cells.setflags(write=False)
+    
+    return letters, positions, cell_of, ascii_cells, matrix_codes
 
-def find_position(matrix, char):
+def create_position_lookup(matrix):
+    """
+    Map each letter of a Playfair matrix to its position.
+    
+    Args:
+        matrix (list): The 5x5 Playfair matrix
+        
+    Returns:
+        dict: (row, col) position of each letter; J shares the position of I
+    """
+    positions = {}
+    for row in range(5):
+        for col in range(5):
+            positions.setdefault(matrix[row][col], (row, col))
+    
+    # Replace J with I in the Playfair cipher
+    if 'I' in positions:
+        positions['J'] = positions['I']
+    
+    return positions
+
+def find_position(matrix, char, positions=None):
     """
     Find the position of a character in the Playfair matrix.
     
     Args:
         matrix (list): The 5x5 Playfair matrix
         char (str): The character to find
+        positions (dict): The matrix's lookup from create_position_lookup, if
+            already built
         
     Returns:
         tuple: (row, col) position of the character
     """
-    char = char.upper()
-    # Replace J with I in the Playfair cipher
-    if char == 'J':
-        char = 'I'
-        
-    for row in range(5):
-        for col in range(5):
-            if matrix[row][col] == char:
-                return (row, col)
+    if positions is None:
+        positions = create_position_lookup(matrix)
+    return positions.get(char.upper())
+
+def _lookup(positions, char):
+    """
+    Find a character's position, trying it as-is before normalizing it.
     
-    return None
+    Prepared text is already uppercase with J folded into I, so the first
+    lookup almost always hits.
+    
+    Args:
+        positions (dict): The matrix's lookup from create_position_lookup
+        char (str): The character to find
+        
+    Returns:
+        tuple: (row, col) position of the character, or None
+    """
+    position = positions.get(char)
+    if position is None:
+        position = positions.get(char.upper())
+    return position
 
-def encrypt_playfair_digraph(matrix, a, b):
+def encrypt_playfair_digraph(matrix, a, b, positions=None):
     """
     Encrypt a digraph (pair of letters) using the Playfair cipher.
     
@@ -67,12 +132,16 @@ def encrypt_playfair_digraph(matrix, a, b):
         matrix (list): The 5x5 Playfair matrix
         a (str): First character of the digraph
         b (str): Second character of the digraph
+        positions (dict): The matrix's lookup from create_position_lookup, if
+            already built
         
     Returns:
         tuple: (encrypted_a, encrypted_b) - The encrypted digraph
     """
-    a_pos = find_position(matrix, a)
-    b_pos = find_position(matrix, b)
+    if positions is None:
+        positions = create_position_lookup(matrix)
+    a_pos = _lookup(positions, a)
+    b_pos = _lookup(positions, b)
     
     if a_pos is None or b_pos is None:
         # Non-alphabetic characters are left unchanged
@@ -93,7 +162,7 @@ def encrypt_playfair_digraph(matrix, a, b):
     else:
         return matrix[a_row][b_col], matrix[b_row][a_col]
 
-def decrypt_playfair_digraph(matrix, a, b):
+def decrypt_playfair_digraph(matrix, a, b, positions=None):
     """
     Decrypt a digraph (pair of letters) using the Playfair cipher.
     
@@ -101,12 +170,16 @@ def decrypt_playfair_digraph(matrix, a, b):
         matrix (list): The 5x5 Playfair matrix
         a (str): First character of the encrypted digraph
         b (str): Second character of the encrypted digraph
+        positions (dict): The matrix's lookup from create_position_lookup, if
+            already built
         
     Returns:
         tuple: (decrypted_a, decrypted_b) - The decrypted digraph
     """
-    a_pos = find_position(matrix, a)
-    b_pos = find_position(matrix, b)
+    if positions is None:
+        positions = create_position_lookup(matrix)
+    a_pos = _lookup(positions, a)
+    b_pos = _lookup(positions, b)
     
     if a_pos is None or b_pos is None:
         # Non-alphabetic characters are left unchanged
@@ -127,6 +200,66 @@ def decrypt_playfair_digraph(matrix, a, b):
     else:
         return matrix[a_row][b_col], matrix[b_row][a_col]
 
+class _PrepTable(dict):
+    """
+    str.translate table that uppercases letters, maps J to I and deletes
+    everything else, filling in characters outside Latin-1 on first use.
+    """
+    
+    def __missing__(self, code):
+        # Uppercasing can expand a character (e.g. 'ß' -> 'SS'), so keep
+        # only the letters of the result
+        upper = chr(code).upper().replace('J', 'I')
+        mapped = ''.join(char for char in upper if char.isalpha()) or None
+        self[code] = mapped
+        return mapped
+
+# Cleaning table for prepare_text_for_playfair, prebuilt for Latin-1
+_PREP_TABLE = _PrepTable()
+for _code in range(256):
+    _PREP_TABLE[_code]
+del _code
+
+def _pair_letters(text):
+    """
+    Clean text and lay it out as consecutive digraphs in one string.
+    
+    Args:
+        text (str): The text to prepare
+        
+    Returns:
+        str: Even-length text where each pair of characters is a digraph
+    """
+    # Convert to uppercase, replace J with I and remove non-alphabetic
+    # characters in a single pass
+    text = text.translate(_PREP_TABLE)
+    
+    # Walk ASCII letters as byte codes, writing pairs into a flat buffer;
+    # other text is walked one character at a time
+    if text.isascii():
+        codes, out, x_code = text.encode("ascii"), bytearray(), ord('X')
+    else:
+        codes, out, x_code = text, [], 'X'
+    count = len(codes)
+    
+    # Split into digraphs and handle repeated letters
+    i = 0
+    while i < count:
+        a = codes[i]
+        if i + 1 < count and codes[i + 1] != a:
+            out.append(a)
+            out.append(codes[i + 1])
+            i += 2
+        else:
+            # Repeated letter or a single letter left: pair it with an 'X'
+            out.append(a)
+            out.append(x_code)
+            i += 1
+    
+    if isinstance(out, bytearray):
+        return out.decode("ascii")
+    return ''.join(out)
+
 def prepare_text_for_playfair(text):
     """
     Prepare text for Playfair encryption by:
@@ -143,30 +276,87 @@ def prepare_text_for_playfair(text):
     Returns:
         list: List of digraphs
     """
-    # Convert to uppercase and replace J with I
-    text = text.upper().replace('J', 'I')
+    letters = _pair_letters(text)
+    return list(zip(letters[0::2], letters[1::2]))
+
+def _build_digraph_cells(step):
+    """
+    Work out the Playfair rules for every possible pair of matrix cells.
     
-    # Remove non-alphabetic characters
-    text = ''.join(char for char in text if char.isalpha())
+    The rules only depend on where the two letters sit, not on which letters
+    they are, so the result holds for every matrix.
     
-    # Split into digraphs and handle repeated letters
-    digraphs = []
-    i = 0
-    while i < len(text):
-        if i + 1 < len(text):
-            # If the two letters are the same, insert an 'X'
-            if text[i] == text[i+1]:
-                digraphs.append((text[i], 'X'))
-                i += 1
-            else:
-                digraphs.append((text[i], text[i+1]))
-                i += 2
-        else:
-            # If there's a single letter left, add an 'X'
-            digraphs.append((text[i], 'X'))
-            i += 1
+    Args:
+        step (int): 1 to encrypt (right/down), -1 to decrypt (left/up)
+        
+    Returns:
+        tuple: (new_a, new_b) arrays of resulting cells (row * 5 + col),
+            indexed by first_cell * 25 + second_cell
+    """
+    a_cells, b_cells = np.divmod(np.arange(625), 25)
+    a_row, a_col = np.divmod(a_cells, 5)
+    b_row, b_col = np.divmod(b_cells, 5)
+    
+    same_row = a_row == b_row
+    same_col = (a_col == b_col) & ~same_row
     
-    return digraphs
+    # Same row: move along the row; same column: move along the column;
+    # rectangle: swap columns
+    new_a = np.where(same_col, (a_row + step) % 5, a_row) * 5 + np.where(
+        same_row, (a_col + step) % 5, np.where(same_col, a_col, b_col))
+    new_b = np.where(same_col, (b_row + step) % 5, b_row) * 5 + np.where(
+        same_row, (b_col + step) % 5, np.where(same_col, b_col, a_col))
+    
+    return new_a, new_b
+
+# Resulting cells for every digraph, for encrypting (1) and decrypting (-1)
+_DIGRAPH_CELLS = {
+    1: _build_digraph_cells(1),
+    -1: _build_digraph_cells(-1)
+}
+
+def transform_digraphs(text, cell_of, ascii_cells, matrix_codes, step):
+    """
+    Apply the Playfair rules to every digraph of a text at once.
+    
+    Each pair of consecutive characters is one digraph. Letters are looked up
+    case-insensitively; pairs where either character is not in the matrix
+    are left unchanged.
+    
+    Args:
+        text (str): The text, of even length
+        cell_of (dict): Cell (row * 5 + col) of each letter in the matrix
+        ascii_cells (numpy.ndarray): Cell of each ASCII code, in either
+            case, or -1 if it is not in the matrix
+        matrix_codes (numpy.ndarray): Code point of the letter in each cell
+        step (int): 1 to encrypt (right/down), -1 to decrypt (left/up)
+        
+    Returns:
+        str: The transformed text
+    """
+    codes = np.frombuffer(text.encode("utf-32-le"), dtype="<u4")
+    
+    # Find each character's matrix cell (row * 5 + col), or -1 if it is not
+    # in the matrix
+    if text.isascii():
+        # Look ASCII text up in the table covering both cases
+        cells = ascii_cells[codes]
+    else:
+        # Other text is looked up one character at a time, like find_position
+        cells = np.array([cell_of.get(char.upper(), -1) for char in text], dtype=np.int16)
+    
+    # Look every digraph's result up by its pair of cells
+    a_cells, b_cells = cells[0::2], cells[1::2]
+    valid = (a_cells >= 0) & (b_cells >= 0)
+    pairs = np.where(valid, a_cells * 25 + b_cells, 0)
+    new_a_cells, new_b_cells = _DIGRAPH_CELLS[step]
+    new_a, new_b = new_a_cells[pairs], new_b_cells[pairs]
+    
+    result = codes.copy()
+    result[0::2] = np.where(valid, matrix_codes[new_a], codes[0::2])
+    result[1::2] = np.where(valid, matrix_codes[new_b], codes[1::2])
+    
+    return result.tobytes().decode("utf-32-le")
 
 def playfair_encrypt(text, key):
     """
@@ -179,15 +369,10 @@ def playfair_encrypt(text, key):
     Returns:
         str: The encrypted text
     """
-    matrix = create_playfair_matrix(key)
-    digraphs = prepare_text_for_playfair(text)
-    
-    encrypted_digraphs = []
-    for a, b in digraphs:
-        encrypted_a, encrypted_b = encrypt_playfair_digraph(matrix, a, b)
-        encrypted_digraphs.append(encrypted_a + encrypted_b)
+    _, _, cell_of, ascii_cells, matrix_codes = _build_playfair_table(key)
     
-    return ''.join(encrypted_digraphs)
+    # Encrypt all the digraphs in one pass
+    return transform_digraphs(_pair_letters(text), cell_of, ascii_cells, matrix_codes, 1)
 
 def playfair_decrypt(text, key):
     """
@@ -200,18 +385,10 @@ def playfair_decrypt(text, key):
     Returns:
         str: The decrypted text
     """
-    matrix = create_playfair_matrix(key)
-    
-    # Split the text into digraphs
-    digraphs = [(text[i], text[i+1]) for i in range(0, len(text), 2) if i+1 < len(text)]
-    
-    decrypted_digraphs = []
-    for a, b in digraphs:
-        decrypted_a, decrypted_b = decrypt_playfair_digraph(matrix, a, b)
-        decrypted_digraphs.append(decrypted_a + decrypted_b)
+    _, _, cell_of, ascii_cells, matrix_codes = _build_playfair_table(key)
     
-    # Join the decrypted digraphs
-    decrypted_text = ''.join(decrypted_digraphs)
+    # Decrypt the text as digraphs, dropping an unpaired last character
+    decrypted_text = transform_digraphs(text[:len(text) - len(text) % 2], cell_of, ascii_cells, matrix_codes, -1)
     
     # Remove padding 'X' characters that might have been added
     # This is a simplified approach and might not be perfect
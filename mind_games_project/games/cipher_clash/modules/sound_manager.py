@@ -3,12 +3,14 @@ Sound Manager module for Cipher Clash game.
 Handles the integration of audio with game events and states.
 """
 
-import os
 import time
+import heapq
+import asyncio
+import itertools
 import threading
 from mind_games_project.games.cipher_clash.modules.audio import (
     init_audio, play_sound, play_music, stop_music,
-    start_adaptive_ticking, stop_adaptive_ticking,
+    adaptive_ticking, stop_adaptive_ticking,
     start_morse_code_background, stop_morse_code,
     adapt_soundtrack, cleanup
 )
@@ -16,6 +18,13 @@ from mind_games_project.games.cipher_clash.modules.audio import (
 class SoundManager:
     """Manages sound effects and music for the game."""
     
+    __slots__ = (
+        "audio_enabled", "music_enabled", "sfx_enabled",
+        "ticking_enabled", "morse_enabled", "time_limit",
+        "time_update_task", "soundtrack_bucket", "running",
+        "schedule", "schedule_cond", "schedule_order", "scheduler_thread", "jobs"
+    )
+    
     def __init__(self):
         """Initialize the sound manager."""
         self.audio_enabled = False
@@ -24,9 +33,18 @@ class SoundManager:
         self.ticking_enabled = False
         self.morse_enabled = False
         self.time_limit = 0
-        self.time_update_thread = None
+        self.time_update_task = None
+        self.soundtrack_bucket = None
         self.running = False
         
+        # Ticking and time updates share one scheduler thread, driven by a
+        # heap of (when, order, name, token, callback) entries
+        self.schedule = []
+        self.schedule_cond = threading.Condition()
+        self.schedule_order = itertools.count()
+        self.scheduler_thread = None
+        self.jobs = {}
+        
     def initialize(self):
         """Initialize audio system."""
         success = init_audio()
@@ -39,6 +57,64 @@ class SoundManager:
             return True
         return False
         
+    def schedule_job(self, name, delay, callback):
+        """
+        Run a callback on the scheduler thread after a delay.
+        
+        The callback returns the delay until its next run, or None to stop.
+        Scheduling a job under a name that is already in use replaces it.
+        
+        Args:
+            name (str): Name of the job
+            delay (float): Seconds until the first run
+            callback: Function taking no arguments
+        """
+        with self.schedule_cond:
+            token = self.jobs[name] = object()
+            heapq.heappush(self.schedule, (time.monotonic() + delay, next(self.schedule_order), name, token, callback))
+            if self.scheduler_thread is None:
+                self.scheduler_thread = threading.Thread(target=self._run_scheduler)
+                self.scheduler_thread.daemon = True
+                self.scheduler_thread.start()
+            self.schedule_cond.notify()
+            
+    def cancel_job(self, name):
+        """
+        Stop a scheduled job from running again.
+        
+        Args:
+            name (str): Name of the job
+        """
+        with self.schedule_cond:
+            self.jobs.pop(name, None)
+            
+    def _run_scheduler(self):
+        """Thread function that runs scheduled jobs until none are left."""
+        schedule = self.schedule
+        while True:
+            with self.schedule_cond:
+                # Drop cancelled or replaced jobs, then wait for the next one
+                while True:
+                    while schedule and self.jobs.get(schedule[0][2]) is not schedule[0][3]:
+                        heapq.heappop(schedule)
+                    if not schedule:
+                        self.scheduler_thread = None
+                        return
+                    wait = schedule[0][0] - time.monotonic()
+                    if wait <= 0:
+                        break
+                    self.schedule_cond.wait(wait)
+                when, _, name, token, callback = heapq.heappop(schedule)
+                
+            delay = callback()
+            
+            with self.schedule_cond:
+                if delay is None:
+                    if self.jobs.get(name) is token:
+                        del self.jobs[name]
+                elif self.jobs.get(name) is token:
+                    heapq.heappush(schedule, (max(when + delay, time.monotonic()), next(self.schedule_order), name, token, callback))
+                    
     def play_game_sound(self, sound_name):
         """
         Play a game sound effect.
@@ -68,11 +144,20 @@ class SoundManager:
         """
         if self.ticking_enabled:
             self.time_limit = time_limit
-            start_adaptive_ticking(time_limit)
+            start_time = time.monotonic()
+            
+            def tick():
+                remaining = time_limit - (time.monotonic() - start_time)
+                if remaining <= 0:
+                    return None
+                return adaptive_ticking(remaining, time_limit)
+            
+            self.schedule_job("ticking", 0, tick)
             
     def stop_game_ticking(self):
         """Stop the adaptive ticking sound."""
         if self.ticking_enabled:
+            self.cancel_job("ticking")
             stop_adaptive_ticking()
             
     def start_morse_message(self, message):
@@ -100,38 +185,68 @@ class SoundManager:
         if self.music_enabled:
             adapt_soundtrack(time_remaining, self.time_limit)
             
+    def _check_soundtrack(self, time_remaining):
+        """
+        Update the soundtrack only when the time crosses a track boundary.
+        
+        Args:
+            time_remaining (float): Remaining time in seconds
+        """
+        # The soundtrack switches to the intense track below 30% time
+        bucket = time_remaining < self.time_limit * 0.3
+        if bucket != self.soundtrack_bucket:
+            self.soundtrack_bucket = bucket
+            self.update_soundtrack(time_remaining)
+            
     def start_time_update_thread(self, get_time_remaining_func):
         """
-        Start a thread to update sounds based on remaining time.
+        Start updating sounds based on remaining time.
+        
+        Runs as a task on the current event loop when called from asyncio
+        code, otherwise as a job on the scheduler thread.
         
         Args:
             get_time_remaining_func: Function that returns remaining time
         """
         self.running = True
-        self.time_update_thread = threading.Thread(
-            target=self._time_update_loop,
-            args=(get_time_remaining_func,)
-        )
-        self.time_update_thread.daemon = True
-        self.time_update_thread.start()
+        self.soundtrack_bucket = None
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+            
+        if loop is not None:
+            self.time_update_task = loop.create_task(
+                self._time_update_task(get_time_remaining_func)
+            )
+            return
+            
+        def update():
+            if not self.running:
+                return None
+            self._check_soundtrack(get_time_remaining_func())
+            return 1  # Update every second
+        
+        self.schedule_job("time_update", 0, update)
         
-    def _time_update_loop(self, get_time_remaining_func):
+    async def _time_update_task(self, get_time_remaining_func):
         """
-        Thread function to update sounds based on time.
+        Coroutine to update sounds based on time.
         
         Args:
             get_time_remaining_func: Function that returns remaining time
         """
         while self.running:
-            time_remaining = get_time_remaining_func()
-            self.update_soundtrack(time_remaining)
-            time.sleep(1)  # Update every second
+            self._check_soundtrack(get_time_remaining_func())
+            await asyncio.sleep(1)  # Update every second
             
     def stop_time_update_thread(self):
-        """Stop the time update thread."""
+        """Stop the time updates, whether they run as a task or a job."""
         self.running = False
-        if self.time_update_thread and self.time_update_thread.is_alive():
-            self.time_update_thread.join(1)
+        if self.time_update_task is not None:
+            self.time_update_task.cancel()
+            self.time_update_task = None
+        self.cancel_job("time_update")
             
     def play_game_event(self, event_name):
         """
@@ -175,6 +290,8 @@ class SoundManager:
             stop_music()
         else:
             self.start_game_music()
+            # Let the next time update pick the right track again
+            self.soundtrack_bucket = None
         return self.music_enabled
         
     def toggle_sfx(self):
@@ -186,6 +303,7 @@ class SoundManager:
         """Toggle ticking sounds on/off."""
         self.ticking_enabled = not self.ticking_enabled
         if not self.ticking_enabled:
+            self.cancel_job("ticking")
             stop_adaptive_ticking()
         return self.ticking_enabled
         
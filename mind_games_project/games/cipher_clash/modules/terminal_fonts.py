@@ -7,15 +7,40 @@ import os
 import sys
 import platform
 import shutil
+import time
+from functools import lru_cache
+from mind_games_project.games.cipher_clash.modules.font_manager import SYNC_BEGIN, SYNC_END, SYNC_OUTPUT
+
+# How long a terminal size reading stays valid, in seconds
+TERMINAL_SIZE_TTL = 0.25
+
+# Time of the last terminal size reading, and the size it returned
+_TERM_SIZE_CACHE = [float("-inf"), (80, 24)]
+
+def sync_write(text):
+    """
+    Write text to the terminal as one synchronized update and flush it.
+    
+    Args:
+        text (str): Text to write
+    """
+    if SYNC_OUTPUT:
+        text = f"{SYNC_BEGIN}{text}{SYNC_END}"
+    sys.stdout.write(text)
+    sys.stdout.flush()
 
 # Get terminal size
 def get_terminal_size():
-    """Get the current terminal size."""
-    try:
-        columns, rows = shutil.get_terminal_size()
-        return columns, rows
-    except:
-        return 80, 24  # Default fallback size
+    """Get the current terminal size, re-reading it at most every TERMINAL_SIZE_TTL seconds."""
+    now = time.monotonic()
+    if now - _TERM_SIZE_CACHE[0] > TERMINAL_SIZE_TTL:
+        try:
+            columns, rows = shutil.get_terminal_size()
+            size = (columns, rows)
+        except:
+            size = (80, 24)  # Default fallback size
+        _TERM_SIZE_CACHE[:] = [now, size]
+    return _TERM_SIZE_CACHE[1]
 
 # ASCII art fonts for titles and headings
 ASCII_FONTS = {
@@ -124,6 +149,13 @@ ASCII_FONTS = {
     }
 }
 
+# Each glyph split into its rows once, so rendering doesn't re-split them
+ASCII_FONTS_LINES = {
+    name: {char: tuple(glyph.rstrip("\n").split("\n")) for char, glyph in font.items()}
+    for name, font in ASCII_FONTS.items()
+}
+
+@lru_cache(maxsize=256)
 def render_ascii_text(text, font_name="standard"):
     """
     Render text using ASCII art font.
@@ -138,33 +170,27 @@ def render_ascii_text(text, font_name="standard"):
     if font_name not in ASCII_FONTS:
         return text
         
-    font = ASCII_FONTS[font_name]
+    font = ASCII_FONTS_LINES[font_name]
     
-    # Convert text to uppercase since our fonts are uppercase only
-    text = text.upper()
+    # Convert text to uppercase since our fonts are uppercase only; titles
+    # are usually uppercase already, which str.isupper checks without a copy
+    if not text.isupper():
+        text = text.upper()
     
     # Get the number of lines in each character
-    num_lines = len(font.get("A", "").split("\n")) - 1
-    
-    # Initialize result lines
-    result_lines = [""] * num_lines
-    
-    # Build each line of the result
-    for char in text:
-        if char in font:
-            char_lines = font[char].split("\n")
-            for i in range(num_lines):
-                if i < len(char_lines):
-                    result_lines[i] += char_lines[i]
-                else:
-                    result_lines[i] += " " * len(char_lines[0])
-        else:
-            # For characters not in the font, add spaces
-            for i in range(num_lines):
-                result_lines[i] += " "
-    
-    # Join the lines with newlines
-    return "\n".join(result_lines)
+    num_lines = len(font.get("A", ()))
+    
+    # Look up each character's rows; characters not in the font become spaces
+    blank = (" ",) * num_lines
+    glyphs = [font.get(char, blank) for char in text]
+    if not glyphs:
+        return "\n" * (num_lines - 1)
+    
+    # Zip the glyphs together row by row and join the lines with newlines
+    return "\n".join("".join(row) for row in zip(*glyphs))
+
+# Padding strings by length, shared by every centered line
+_PAD_CACHE = {}
 
 def center_text(text, width=None):
     """
@@ -180,14 +206,34 @@ def center_text(text, width=None):
     if width is None:
         width, _ = get_terminal_size()
         
-    lines = text.split("\n")
-    centered_lines = []
+    return _center_lines(text, width)
+
+@lru_cache(maxsize=256)
+def _center_lines(text, width):
+    """
+    Center each line of text within a fixed width.
     
-    for line in lines:
-        padding = (width - len(line)) // 2
-        centered_lines.append(" " * padding + line)
+    Args:
+        text (str): Text to center
+        width (int): Width to center within
         
-    return "\n".join(centered_lines)
+    Returns:
+        str: Centered text
+    """
+    # Split on newlines only (not splitlines), so other line breaks and a
+    # trailing empty line are kept as before
+    pieces = []
+    for line in text.split("\n"):
+        padding = max((width - len(line)) // 2, 0)
+        pad = _PAD_CACHE.get(padding)
+        if pad is None:
+            pad = _PAD_CACHE[padding] = " " * padding
+        pieces.append(pad)
+        pieces.append(line)
+        pieces.append("\n")
+        
+    # Join everything at once, dropping the last newline
+    return "".join(pieces[:-1])
 
 def render_title(title, centered=True):
     """
@@ -207,6 +253,67 @@ def render_title(title, centered=True):
     else:
         return ascii_title
 
+@lru_cache(maxsize=32)
+def _banner_text(title, width):
+    """
+    Render a centered ASCII art title as one block of output.
+    
+    Args:
+        title (str): Title to render
+        width (int): Width to center within
+        
+    Returns:
+        str: The title followed by a newline, wrapped for a synchronized
+            update when the terminal supports it
+    """
+    text = f"{_center_lines(render_ascii_text(title), width)}\n"
+    if SYNC_OUTPUT:
+        text = f"{SYNC_BEGIN}{text}{SYNC_END}"
+    return text
+
+@lru_cache(maxsize=32)
+def _banner_bytes(title, width, encoding, errors):
+    """
+    Encode a banner from _banner_text for a stream's byte buffer.
+    
+    Args:
+        title (str): Title to render
+        width (int): Width to center within
+        encoding (str): Encoding of the output stream
+        errors (str): Encoding error handler of the output stream
+        
+    Returns:
+        bytes: The encoded banner
+    """
+    return _banner_text(title, width).encode(encoding, errors)
+
+def write_banner(title, stream=None):
+    """
+    Write a centered ASCII art title straight to a stream's byte buffer.
+    
+    The encoded banner is cached per title and terminal width, so repeated
+    screens skip rendering and encoding entirely.
+    
+    Args:
+        title (str): Title to render
+        stream: Text stream to write to (defaults to sys.stdout)
+    """
+    if stream is None:
+        stream = sys.stdout
+    width, _ = get_terminal_size()
+    
+    buffer = getattr(stream, "buffer", None)
+    if buffer is None:
+        # In-memory streams have no byte buffer, so write the text instead
+        stream.write(_banner_text(title, width))
+        stream.flush()
+        return
+    
+    # Flush pending text first so the banner lands in order
+    stream.flush()
+    buffer.write(_banner_bytes(title, width, stream.encoding, stream.errors))
+    buffer.flush()
+
 # Test function
 def test_fonts():
     """Test the ASCII fonts."""
@@ -3,21 +3,272 @@ Tutorial module for Cipher Clash game.
 Provides interactive tutorials for different cipher types.
 """
 
-import time
+import sys
 import random
-import string
+from functools import lru_cache
 from mind_games_project.games.cipher_clash.modules.encryption import (
     caesar_cipher, atbash_cipher, reverse_cipher,
-    vigenere_cipher, transposition_cipher
+    vigenere_cipher, vigenere_decrypt, transposition_cipher
 )
+from mind_games_project.games.cipher_clash.modules.playfair import playfair_encrypt, playfair_decrypt
 from mind_games_project.games.cipher_clash.modules.cipher_helper import get_cipher_description
+from mind_games_project.games.cipher_clash.modules.terminal_fonts import sync_write
+
+# Random source for the practice puzzles
+_rng = random.Random()
+
+# Terminal width for formatting
+TUTORIAL_WIDTH = 80
+
+# The tutorial menu never changes, so lay it out once
+_BAR = "=" * TUTORIAL_WIDTH
+_TUTORIAL_MENU = "\n".join([
+    _BAR,
+    "CIPHER CLASH TUTORIALS".center(TUTORIAL_WIDTH),
+    _BAR,
+    "\nSelect a cipher type to learn about:",
+    "1. Caesar Cipher",
+    "2. Atbash Cipher",
+    "3. Reverse Cipher",
+    "4. Substitution Cipher",
+    "5. Vigenère Cipher",
+    "6. Transposition Cipher",
+    "7. Playfair Cipher",
+    "0. Return to Main Menu"
+]) + "\n"
+
+# Fixed pieces of every tutorial
+_DIVIDER = "-" * TUTORIAL_WIDTH
+_PRACTICE_HEADER = f"\n{_DIVIDER}\n\nPRACTICE:\n\n"
+_TUTORIAL_FOOTER = f"\n{_BAR}\n" + "Tutorial Complete!".center(TUTORIAL_WIDTH) + f"\n{_BAR}\n"
+
+# Sample plaintext messages for the worked examples
+SAMPLE_TEXTS = (
+    "HELLO WORLD",
+    "CIPHER CLASH",
+    "SECRET MESSAGE"
+)
+
+# Plaintexts to choose from for practice
+PRACTICE_WORDS = ("HELLO", "WORLD", "CIPHER", "SECRET", "MESSAGE", "CODE", "PUZZLE")
+
+# ROT13 tables for the substitution examples, built once
+_UPPER = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_ROT13 = _UPPER[13:] + _UPPER[:13]
+_ROT13_ENC = str.maketrans(_UPPER, _ROT13)
+_ROT13_DEC = str.maketrans(_ROT13, _UPPER)
+
+# Cipher type for each menu choice; None returns to the main menu
+_MENU_MAP = {
+    '0': None,
+    '1': 'caesar',
+    '2': 'atbash',
+    '3': 'reverse',
+    '4': 'substitution',
+    '5': 'vigenere',
+    '6': 'transposition',
+    '7': 'playfair'
+}
+
+# Feedback for a practice answer
+_CORRECT_MSG = "Correct! You've successfully decrypted the message."
+_WRONG_MSG = "Not quite. The correct decryption is: {}".format
+
+def _check_answer(user_input, plaintext):
+    """
+    Tell the player whether their practice answer was right.
+    
+    Args:
+        user_input (str): The player's normalized answer
+        plaintext (str): The correct decryption
+    """
+    print(_CORRECT_MSG if user_input == plaintext else _WRONG_MSG(plaintext))
+
+def _caesar_example(text):
+    """Caesar cipher with a shift of 3."""
+    shift = 3
+    encrypted = caesar_cipher(text, shift)
+    return [
+        f"Caesar Cipher (Shift {shift}): {encrypted}",
+        f"Decrypted: {caesar_cipher(encrypted, 26 - shift)}"
+    ]
+
+def _atbash_example(text):
+    """Atbash is its own inverse."""
+    encrypted = atbash_cipher(text)
+    return [f"Atbash Cipher: {encrypted}", f"Decrypted: {atbash_cipher(encrypted)}"]
+
+def _reverse_example(text):
+    """Reversing is its own inverse."""
+    encrypted = reverse_cipher(text)
+    return [f"Reverse Cipher: {encrypted}", f"Decrypted: {reverse_cipher(encrypted)}"]
+
+def _substitution_example(text):
+    """ROT13 as a simple substitution."""
+    encrypted = text.translate(_ROT13_ENC)
+    return [f"Substitution Cipher: {encrypted}", f"Decrypted: {encrypted.translate(_ROT13_DEC)}"]
+
+def _vigenere_example(text):
+    """Vigenère cipher with the key KEY, decrypted by the inverse operation."""
+    key = "KEY"
+    encrypted = vigenere_cipher(text, key)
+    return [f"Vigenère Cipher (Key: {key}): {encrypted}", f"Decrypted: {vigenere_decrypt(encrypted, key)}"]
+
+def _transposition_example(text):
+    """Transposition over 3 columns; decryption is only described."""
+    columns = 3
+    encrypted = transposition_cipher(text, columns)
+    return [
+        f"Transposition Cipher ({columns} columns): {encrypted}",
+        "Decryption involves rearranging the columns back to rows."
+    ]
+
+def _playfair_example(text):
+    """Playfair cipher with the key CIPHER."""
+    key = "CIPHER"
+    encrypted = playfair_encrypt(text, key)
+    return [f"Playfair Cipher (Key: {key}): {encrypted}", f"Decrypted: {playfair_decrypt(encrypted, key)}"]
+
+# Example builders for _example_text, keyed by cipher type; each returns the
+# lines shown under one sample plaintext
+_EXAMPLES = {
+    'caesar': _caesar_example,
+    'atbash': _atbash_example,
+    'reverse': _reverse_example,
+    'substitution': _substitution_example,
+    'vigenere': _vigenere_example,
+    'transposition': _transposition_example,
+    'playfair': _playfair_example
+}
+
+@lru_cache(maxsize=None)
+def _tutorial_header(cipher_type):
+    """
+    Build the opening of a tutorial: its banner, description and the
+    examples heading.
+    
+    Args:
+        cipher_type (str): The type of cipher
+        
+    Returns:
+        str: The header, ready to print
+    """
+    title = f"{cipher_type.upper()} CIPHER TUTORIAL".center(TUTORIAL_WIDTH)
+    description = get_cipher_description(cipher_type)
+    return (
+        f"\n{_BAR}\n"
+        f"{title}\n"
+        f"{_BAR}\n\n"
+        f"{description}\n"
+        f"\n{_DIVIDER}\n\n"
+        "EXAMPLES:\n\n"
+    )
+
+@lru_cache(maxsize=None)
+def _example_text(cipher_type):
+    """
+    Build the worked examples for a cipher type.
+    
+    The samples and keys are fixed, so each cipher's examples are only
+    worked out once.
+    
+    Args:
+        cipher_type (str): The type of cipher
+        
+    Returns:
+        str: The examples, ready to print
+    """
+    build_example = _EXAMPLES.get(cipher_type)
+    
+    # Collect every example's lines into one block
+    lines = []
+    for text in SAMPLE_TEXTS:
+        lines.append(f"Plaintext: {text}")
+        if build_example is not None:
+            lines.extend(build_example(text))
+        lines.append("")
+    
+    return "\n".join(lines) + "\n"
+
+def _caesar_practice(plaintext):
+    """Caesar cipher with a random shift."""
+    shift = _rng.randint(1, 25)
+    return [
+        f"This text has been encrypted with a Caesar cipher using shift {shift}.",
+        f"Encrypted: {caesar_cipher(plaintext, shift)}",
+        "\nTry to decrypt it by shifting each letter back by the same amount."
+    ]
+
+def _atbash_practice(plaintext):
+    """Atbash has no parameters."""
+    return [
+        "This text has been encrypted with an Atbash cipher.",
+        f"Encrypted: {atbash_cipher(plaintext)}",
+        "\nTry to decrypt it by replacing each letter with its mirror in the alphabet."
+    ]
+
+def _reverse_practice(plaintext):
+    """Reverse has no parameters."""
+    return [
+        "This text has been encrypted with a Reverse cipher.",
+        f"Encrypted: {reverse_cipher(plaintext)}",
+        "\nTry to decrypt it by reading it backwards."
+    ]
+
+def _substitution_practice(plaintext):
+    """ROT13 as a simple substitution."""
+    return [
+        "This text has been encrypted with a Substitution cipher.",
+        f"Encrypted: {plaintext.translate(_ROT13_ENC)}",
+        "For this example, we're using ROT13 (each letter is replaced by the one 13 positions after it).",
+        "\nTry to decrypt it by reversing the substitution."
+    ]
+
+def _vigenere_practice(plaintext):
+    """Vigenère cipher with the key KEY."""
+    key = "KEY"
+    return [
+        f"This text has been encrypted with a Vigenère cipher using the key '{key}'.",
+        f"Encrypted: {vigenere_cipher(plaintext, key)}",
+        "\nTry to decrypt it using the key."
+    ]
+
+def _transposition_practice(plaintext):
+    """Transposition over 3 columns."""
+    columns = 3
+    return [
+        f"This text has been encrypted with a Transposition cipher using {columns} columns.",
+        f"Encrypted: {transposition_cipher(plaintext, columns)}",
+        "\nTry to decrypt it by rearranging the letters."
+    ]
+
+def _playfair_practice(plaintext):
+    """Playfair cipher with the key CIPHER."""
+    key = "CIPHER"
+    return [
+        f"This text has been encrypted with a Playfair cipher using the key '{key}'.",
+        f"Encrypted: {playfair_encrypt(plaintext, key)}",
+        "\nTry to decrypt it using the Playfair rules."
+    ]
+
+# Practice builders for interactive_practice, keyed by cipher type; each
+# returns the lines explaining the puzzle, ending with the instructions
+_PRACTICE = {
+    'caesar': _caesar_practice,
+    'atbash': _atbash_practice,
+    'reverse': _reverse_practice,
+    'substitution': _substitution_practice,
+    'vigenere': _vigenere_practice,
+    'transposition': _transposition_practice,
+    'playfair': _playfair_practice
+}
 
 class CipherTutorial:
     """Class for providing interactive cipher tutorials."""
     
     def __init__(self):
         """Initialize the tutorial."""
-        self.width = 80  # Terminal width for formatting
+        self.width = TUTORIAL_WIDTH  # Terminal width for formatting
     
     def show_tutorial_menu(self):
         """
@@ -26,38 +277,13 @@ class CipherTutorial:
         Returns:
             str: Selected cipher type or None if user exits
         """
-        print("=" * self.width)
-        print("CIPHER CLASH TUTORIALS".center(self.width))
-        print("=" * self.width)
-        print("\nSelect a cipher type to learn about:")
-        print("1. Caesar Cipher")
-        print("2. Atbash Cipher")
-        print("3. Reverse Cipher")
-        print("4. Substitution Cipher")
-        print("5. Vigenère Cipher")
-        print("6. Transposition Cipher")
-        print("7. Playfair Cipher")
-        print("0. Return to Main Menu")
+        sync_write(_TUTORIAL_MENU)
         
         while True:
             choice = input("\nEnter your choice (0-7): ")
-            if choice == '0':
-                return None
-            elif choice == '1':
-                return 'caesar'
-            elif choice == '2':
-                return 'atbash'
-            elif choice == '3':
-                return 'reverse'
-            elif choice == '4':
-                return 'substitution'
-            elif choice == '5':
-                return 'vigenere'
-            elif choice == '6':
-                return 'transposition'
-            elif choice == '7':
-                return 'playfair'
-            else:
+            try:
+                return _MENU_MAP[choice]
+            except KeyError:
                 print("Invalid choice. Please try again.")
     
     def run_tutorial(self, cipher_type):
@@ -67,27 +293,16 @@ class CipherTutorial:
         Args:
             cipher_type (str): The type of cipher for the tutorial
         """
-        print("\n" + "=" * self.width)
-        print(f"{cipher_type.upper()} CIPHER TUTORIAL".center(self.width))
-        print("=" * self.width + "\n")
-        
-        # Show description
-        description = get_cipher_description(cipher_type)
-        print(description)
-        print("\n" + "-" * self.width + "\n")
-        
-        # Show examples
-        print("EXAMPLES:\n")
+        # Show the header and description, then the examples
+        sync_write(_tutorial_header(cipher_type))
         self.show_cipher_examples(cipher_type)
-        print("\n" + "-" * self.width + "\n")
         
         # Interactive practice
-        print("PRACTICE:\n")
+        sys.stdout.write(_PRACTICE_HEADER)
         self.interactive_practice(cipher_type)
         
-        print("\n" + "=" * self.width)
-        print("Tutorial Complete!".center(self.width))
-        print("=" * self.width)
+        sys.stdout.write(_TUTORIAL_FOOTER)
+        sys.stdout.flush()
         input("\nPress Enter to continue...")
     
     def show_cipher_examples(self, cipher_type):
@@ -97,74 +312,7 @@ class CipherTutorial:
         Args:
             cipher_type (str): The type of cipher
         """
-        # Sample plaintext messages
-        sample_texts = [
-            "HELLO WORLD",
-            "CIPHER CLASH",
-            "SECRET MESSAGE"
-        ]
-        
-        # Show examples for each sample text
-        for text in sample_texts:
-            print(f"Plaintext: {text}")
-            
-            if cipher_type == 'caesar':
-                shift = 3
-                encrypted = caesar_cipher(text, shift)
-                print(f"Caesar Cipher (Shift {shift}): {encrypted}")
-                print(f"Decrypted: {caesar_cipher(encrypted, 26 - shift)}")
-                
-            elif cipher_type == 'atbash':
-                encrypted = atbash_cipher(text)
-                print(f"Atbash Cipher: {encrypted}")
-                print(f"Decrypted: {atbash_cipher(encrypted)}")
-                
-            elif cipher_type == 'reverse':
-                encrypted = reverse_cipher(text)
-                print(f"Reverse Cipher: {encrypted}")
-                print(f"Decrypted: {reverse_cipher(encrypted)}")
-                
-            elif cipher_type == 'substitution':
-                # Create a simple substitution for the example
-                alphabet = string.ascii_uppercase
-                shifted = alphabet[13:] + alphabet[:13]  # ROT13 for simplicity
-                substitution_map = dict(zip(alphabet, shifted))
-                
-                encrypted = ''.join(substitution_map.get(c, c) for c in text)
-                print(f"Substitution Cipher: {encrypted}")
-                
-                # Reverse the substitution map for decryption
-                reverse_map = dict(zip(shifted, alphabet))
-                decrypted = ''.join(reverse_map.get(c, c) for c in encrypted)
-                print(f"Decrypted: {decrypted}")
-                
-            elif cipher_type == 'vigenere':
-                key = "KEY"
-                encrypted = vigenere_cipher(text, key)
-                print(f"Vigenère Cipher (Key: {key}): {encrypted}")
-                
-                # Decrypt by using the inverse operation
-                from mind_games_project.games.cipher_clash.modules.encryption import vigenere_decrypt
-                decrypted = vigenere_decrypt(encrypted, key)
-                print(f"Decrypted: {decrypted}")
-                
-            elif cipher_type == 'transposition':
-                columns = 3
-                encrypted = transposition_cipher(text, columns)
-                print(f"Transposition Cipher ({columns} columns): {encrypted}")
-                
-                # Decryption would be more complex, so we'll just note that
-                print("Decryption involves rearranging the columns back to rows.")
-                
-            elif cipher_type == 'playfair':
-                key = "CIPHER"
-                from mind_games_project.games.cipher_clash.modules.playfair import playfair_encrypt, playfair_decrypt
-                encrypted = playfair_encrypt(text, key)
-                print(f"Playfair Cipher (Key: {key}): {encrypted}")
-                decrypted = playfair_decrypt(encrypted, key)
-                print(f"Decrypted: {decrypted}")
-            
-            print()
+        sys.stdout.write(_example_text(cipher_type))
     
     def interactive_practice(self, cipher_type):
         """
@@ -173,123 +321,25 @@ class CipherTutorial:
         Args:
             cipher_type (str): The type of cipher
         """
-        print("Let's practice with this cipher!\n")
+        lines = ["Let's practice with this cipher!\n"]
         
         # Generate a simple plaintext
-        words = ["HELLO", "WORLD", "CIPHER", "SECRET", "MESSAGE", "CODE", "PUZZLE"]
-        plaintext = random.choice(words)
+        plaintext = _rng.choice(PRACTICE_WORDS)
         
-        print(f"Plaintext: {plaintext}")
+        lines.append(f"Plaintext: {plaintext}")
         
         # Encrypt based on cipher type
-        if cipher_type == 'caesar':
-            shift = random.randint(1, 25)
-            encrypted = caesar_cipher(plaintext, shift)
-            print(f"This text has been encrypted with a Caesar cipher using shift {shift}.")
-            print(f"Encrypted: {encrypted}")
-            
-            # Ask user to decrypt
-            print("\nTry to decrypt it by shifting each letter back by the same amount.")
-            user_input = input("Your decryption: ").strip().upper()
-            
-            if user_input == plaintext:
-                print("Correct! You've successfully decrypted the message.")
-            else:
-                print(f"Not quite. The correct decryption is: {plaintext}")
-                
-        elif cipher_type == 'atbash':
-            encrypted = atbash_cipher(plaintext)
-            print("This text has been encrypted with an Atbash cipher.")
-            print(f"Encrypted: {encrypted}")
-            
-            # Ask user to decrypt
-            print("\nTry to decrypt it by replacing each letter with its mirror in the alphabet.")
-            user_input = input("Your decryption: ").strip().upper()
-            
-            if user_input == plaintext:
-                print("Correct! You've successfully decrypted the message.")
-            else:
-                print(f"Not quite. The correct decryption is: {plaintext}")
-                
-        elif cipher_type == 'reverse':
-            encrypted = reverse_cipher(plaintext)
-            print("This text has been encrypted with a Reverse cipher.")
-            print(f"Encrypted: {encrypted}")
-            
-            # Ask user to decrypt
-            print("\nTry to decrypt it by reading it backwards.")
-            user_input = input("Your decryption: ").strip().upper()
-            
-            if user_input == plaintext:
-                print("Correct! You've successfully decrypted the message.")
-            else:
-                print(f"Not quite. The correct decryption is: {plaintext}")
-                
-        elif cipher_type == 'substitution':
-            # Use a simple substitution for practice
-            alphabet = string.ascii_uppercase
-            shifted = alphabet[13:] + alphabet[:13]  # ROT13 for simplicity
-            substitution_map = dict(zip(alphabet, shifted))
-            
-            encrypted = ''.join(substitution_map.get(c, c) for c in plaintext)
-            print("This text has been encrypted with a Substitution cipher.")
-            print(f"Encrypted: {encrypted}")
-            print("For this example, we're using ROT13 (each letter is replaced by the one 13 positions after it).")
-            
-            # Ask user to decrypt
-            print("\nTry to decrypt it by reversing the substitution.")
-            user_input = input("Your decryption: ").strip().upper()
-            
-            if user_input == plaintext:
-                print("Correct! You've successfully decrypted the message.")
-            else:
-                print(f"Not quite. The correct decryption is: {plaintext}")
-                
-        elif cipher_type == 'vigenere':
-            key = "KEY"
-            encrypted = vigenere_cipher(plaintext, key)
-            print(f"This text has been encrypted with a Vigenère cipher using the key '{key}'.")
-            print(f"Encrypted: {encrypted}")
-            
-            # Ask user to decrypt
-            print("\nTry to decrypt it using the key.")
-            user_input = input("Your decryption: ").strip().upper()
-            
-            if user_input == plaintext:
-                print("Correct! You've successfully decrypted the message.")
-            else:
-                print(f"Not quite. The correct decryption is: {plaintext}")
-                
-        elif cipher_type == 'transposition':
-            columns = 3
-            encrypted = transposition_cipher(plaintext, columns)
-            print(f"This text has been encrypted with a Transposition cipher using {columns} columns.")
-            print(f"Encrypted: {encrypted}")
-            
-            # Ask user to decrypt
-            print("\nTry to decrypt it by rearranging the letters.")
-            user_input = input("Your decryption: ").strip().upper()
-            
-            if user_input == plaintext:
-                print("Correct! You've successfully decrypted the message.")
-            else:
-                print(f"Not quite. The correct decryption is: {plaintext}")
-                
-        elif cipher_type == 'playfair':
-            key = "CIPHER"
-            from mind_games_project.games.cipher_clash.modules.playfair import playfair_encrypt
-            encrypted = playfair_encrypt(plaintext, key)
-            print(f"This text has been encrypted with a Playfair cipher using the key '{key}'.")
-            print(f"Encrypted: {encrypted}")
-            
-            # Ask user to decrypt
-            print("\nTry to decrypt it using the Playfair rules.")
-            user_input = input("Your decryption: ").strip().upper()
-            
-            if user_input == plaintext:
-                print("Correct! You've successfully decrypted the message.")
-            else:
-                print(f"Not quite. The correct decryption is: {plaintext}")
+        build_practice = _PRACTICE.get(cipher_type)
+        if build_practice is None:
+            sys.stdout.write("\n".join(lines) + "\n")
+            return
+        lines.extend(build_practice(plaintext))
+        
+        # Show the puzzle in one write, then ask user to decrypt
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+        user_input = input("Your decryption: ").strip().upper()
+        _check_answer(user_input, plaintext)
 
 def run_tutorials():
     """Run the cipher tutorials."""
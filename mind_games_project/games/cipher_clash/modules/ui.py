@@ -4,10 +4,11 @@ Handles user interface elements and interactions.
 """
 
 import os
+import bisect
 import sys
 import time
-from mind_games_project.games.cipher_clash.modules.font_manager import font_manager
-from mind_games_project.games.cipher_clash.modules.terminal_fonts import render_title, center_text
+from mind_games_project.games.cipher_clash.modules.font_manager import font_manager, ANSI_SUPPORTED
+from mind_games_project.games.cipher_clash.modules.terminal_fonts import center_text, write_banner
 
 class CipherUI:
     """User interface class for Cipher Clash game."""
@@ -16,34 +17,69 @@ class CipherUI:
         """Initialize the UI."""
         self.width = 80  # Terminal width for formatting
         
+        # ANSI erase-display + cursor-home, or None for consoles without VT mode
+        if ANSI_SUPPORTED:
+            self._clear_seq = "\x1b[2J\x1b[H"
+        else:
+            self._clear_seq = None
+        
+        # Pieces that never change between redraws; the styled ones are
+        # built by _static_text for each styling setting
+        self._eq_rule = "=" * self.width
+        self._dash_rule = "-" * self.width
+        self._styled_static = {}
+        
+    def _static_text(self):
+        """
+        Get the styled pieces of the UI that never change between redraws.
+        
+        They are built once per styling setting, so toggling styling picks
+        up the matching set.
+        
+        Returns:
+            tuple: (title_centered, decrypt_header, subtitle, intro_body)
+        """
+        styled = font_manager.use_styling
+        static = self._styled_static.get(styled)
+        if static is None:
+            title_centered = font_manager.style_text("CIPHER CLASH", "title").center(self.width)
+            decrypt_header = font_manager.style_text("DECRYPT THIS MESSAGE:", "heading")
+            subtitle = font_manager.style_text("DECRYPT. SOLVE. SURVIVE.", "subtitle")
+            intro_body = "".join((
+                f"\n{self._eq_rule}\n",
+                font_manager.style_text("Welcome to Cipher Clash, a game of cryptographic puzzles!", "info"), "\n",
+                "\nIn this game, you'll be presented with encrypted messages.\n"
+                "Your task is to decrypt them and enter the correct solution.\n"
+                "Solve as many ciphers as you can before time runs out!\n",
+                "\n", font_manager.style_text("Commands:", "heading"), "\n",
+                "  - Enter your solution to solve the cipher\n"
+                "  - Type 'hint' to get a hint (costs 50 points, max 3 per cipher)\n"
+                "  - Type 'skip' to skip the current cipher (costs 100 points)\n"
+                "  - Type 'help' to see available commands\n"
+                "  - Type 'quit' to exit the game\n",
+                f"\n{self._eq_rule}\n"
+            ))
+            static = self._styled_static[styled] = (title_centered, decrypt_header, subtitle, intro_body)
+        return static
+        
     def clear_screen(self):
         """Clear the terminal screen."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        if self._clear_seq:
+            sys.stdout.write(self._clear_seq)
+            sys.stdout.flush()
+        else:
+            os.system('cls')
         
     def show_intro(self):
         """Display the game introduction."""
         self.clear_screen()
         
         # Display ASCII art title
-        title_art = render_title("CIPHER CLASH")
-        print(title_art)
-        
-        # Display styled subtitle
-        subtitle = font_manager.style_text("DECRYPT. SOLVE. SURVIVE.", "subtitle")
-        print(center_text(subtitle))
-        
-        print("\n" + "=" * self.width)
-        print(font_manager.style_text("Welcome to Cipher Clash, a game of cryptographic puzzles!", "info"))
-        print("\nIn this game, you'll be presented with encrypted messages.")
-        print("Your task is to decrypt them and enter the correct solution.")
-        print("Solve as many ciphers as you can before time runs out!")
-        print("\n" + font_manager.style_text("Commands:", "heading"))
-        print("  - Enter your solution to solve the cipher")
-        print("  - Type 'hint' to get a hint (costs 50 points, max 3 per cipher)")
-        print("  - Type 'skip' to skip the current cipher (costs 100 points)")
-        print("  - Type 'help' to see available commands")
-        print("  - Type 'quit' to exit the game")
-        print("\n" + "=" * self.width)
+        write_banner("CIPHER CLASH")
+        
+        # Display styled subtitle and the rules as one write
+        _, _, subtitle, intro_body = self._static_text()
+        font_manager.render_frame(center_text(subtitle), "\n", intro_body)
         input("\nPress Enter to start the game...")
         
     def display_game_state(self, cipher, score, ciphers_solved, attempts_remaining, time_remaining, hints_used=0, max_hints=3):
@@ -59,25 +95,21 @@ class CipherUI:
             hints_used (int): Number of hints used for current cipher
             max_hints (int): Maximum hints allowed per cipher
         """
-        self.clear_screen()
-        
-        # Display header
-        print("=" * self.width)
-        print(font_manager.style_text("CIPHER CLASH", "title").center(self.width))
-        print("=" * self.width)
+        # Fold the clear into the frame when the terminal understands ANSI
+        if self._clear_seq:
+            clear = self._clear_seq
+        else:
+            self.clear_screen()
+            clear = ""
         
         # Display game stats with styled text
         stats = font_manager.format_game_stats(
             score, ciphers_solved, attempts_remaining, 
             time_remaining, time_remaining * 2  # Double for time limit comparison
         )
-        print(stats)
         
         # Display hints info
         hints_info = font_manager.style_text(f"Hints: {hints_used}/{max_hints}", "info")
-        print(hints_info)
-        
-        print("-" * self.width)
         
         # Parse cipher text to separate type and content
         cipher_parts = cipher.split('\n', 1)
@@ -88,11 +120,20 @@ class CipherUI:
             cipher_type = "Unknown Cipher"
             cipher_content = cipher
         
-        # Display the cipher with styled text
-        print("\n" + font_manager.style_text("DECRYPT THIS MESSAGE:", "heading"))
-        print("\n" + font_manager.style_text(cipher_type, "cipher_type"))
-        print(font_manager.style_text(cipher_content, "cipher_text"))
-        print("\n" + "-" * self.width)
+        # Draw the header, stats and cipher as one frame
+        title_centered, decrypt_header, _, _ = self._static_text()
+        font_manager.render_frame(
+            f"{clear}{self._eq_rule}\n"
+            f"{title_centered}\n"
+            f"{self._eq_rule}\n"
+            f"{stats}\n"
+            f"{hints_info}\n"
+            f"{self._dash_rule}\n"
+            f"\n{decrypt_header}\n"
+            f"\n{font_manager.style_text(cipher_type, 'cipher_type')}\n"
+            f"{font_manager.style_text(cipher_content, 'cipher_text')}\n"
+            f"\n{self._dash_rule}\n"
+        )
         
     def get_player_input(self):
         """
@@ -111,12 +152,14 @@ class CipherUI:
         Args:
             points (int): Points earned for this solution
         """
-        print("\n" + "=" * self.width)
         success_message = font_manager.format_success_message("CORRECT!")
-        print(success_message.center(self.width))
         points_message = font_manager.style_text(f"You earned {points} points!", "score")
-        print(points_message.center(self.width))
-        print("=" * self.width)
+        font_manager.render_frame(
+            f"\n{self._eq_rule}\n",
+            success_message.center(self.width), "\n",
+            points_message.center(self.width), "\n",
+            f"{self._eq_rule}\n"
+        )
         input("\nPress Enter to continue to the next cipher...")
         
     def show_incorrect_message(self, attempts_remaining):
@@ -127,9 +170,8 @@ class CipherUI:
             attempts_remaining (int): Number of attempts remaining
         """
         error_message = font_manager.format_error_message("Incorrect solution!")
-        print("\n" + error_message)
         attempts_message = font_manager.style_text(f"You have {attempts_remaining} attempts remaining.", "warning")
-        print(attempts_message)
+        font_manager.render_frame(f"\n{error_message}\n", f"{attempts_message}\n")
         input("\nPress Enter to try again...")
         
     def show_hint(self, hint, cost):
@@ -140,10 +182,8 @@ class CipherUI:
             hint (str): The hint to display
             cost (int): The point cost of the hint
         """
-        print("\n" + "-" * self.width)
         hint_display = font_manager.format_hint(hint, cost)
-        print(hint_display)
-        print("-" * self.width)
+        font_manager.render_frame(f"\n{self._dash_rule}\n", f"{hint_display}\n", f"{self._dash_rule}\n")
         input("\nPress Enter to continue...")
         
     def show_message(self, message):
@@ -153,7 +193,7 @@ class CipherUI:
         Args:
             message (str): The message to display
         """
-        print("\n" + font_manager.style_text(message, "info"))
+        font_manager.render_frame("\n", font_manager.style_text(message, "info"), "\n")
         input("\nPress Enter to continue...")
         
     def show_game_over(self, message, score, ciphers_solved, time_taken, high_scores=None):
@@ -170,38 +210,37 @@ class CipherUI:
         self.clear_screen()
         
         # Display game over title
-        game_over_title = render_title("GAME OVER")
-        print(game_over_title)
+        write_banner("GAME OVER")
         
-        print("=" * self.width)
         message_styled = font_manager.style_text(message, "warning")
-        print(f"\n{message_styled}".center(self.width))
-        print("\n" + "-" * self.width)
         
         # Display results with styled text
-        print(font_manager.style_text("FINAL RESULTS:", "heading").center(self.width))
-        print(font_manager.style_text(f"Score: {score}", "score").center(self.width))
-        print(font_manager.style_text(f"Ciphers Solved: {ciphers_solved}", "info").center(self.width))
-        print(font_manager.style_text(f"Time: {time_taken}", "info").center(self.width))
-        print("-" * self.width)
+        parts = [
+            f"{self._eq_rule}\n",
+            f"\n{message_styled}".center(self.width), "\n",
+            f"\n{self._dash_rule}\n",
+            font_manager.style_text("FINAL RESULTS:", "heading").center(self.width), "\n",
+            font_manager.style_text(f"Score: {score}", "score").center(self.width), "\n",
+            font_manager.style_text(f"Ciphers Solved: {ciphers_solved}", "info").center(self.width), "\n",
+            font_manager.style_text(f"Time: {time_taken}", "info").center(self.width), "\n",
+            f"{self._dash_rule}\n"
+        ]
         
         # Show high score comparison if available
         if high_scores:
             if not high_scores:
-                print("\n" + font_manager.style_text("You're the first to set a high score!", "success"))
+                parts += ("\n", font_manager.style_text("You're the first to set a high score!", "success"), "\n")
             else:
                 top_score = high_scores[0]['score'] if high_scores else 0
                 if score > top_score:
-                    print("\n" + font_manager.style_text("Congratulations! You've set a new high score!", "success"))
+                    parts += ("\n", font_manager.style_text("Congratulations! You've set a new high score!", "success"), "\n")
                 elif score > 0:
-                    # Find where this score would rank
-                    rank = 1
-                    for hs in high_scores:
-                        if score <= hs['score']:
-                            rank += 1
-                        else:
-                            break
-                    print(f"\n" + font_manager.style_text(f"Your score ranks #{rank} on the leaderboard!", "info"))
+                    # Find where this score would rank; scores tied with it stay ahead
+                    neg_scores = [-hs['score'] for hs in high_scores]
+                    rank = bisect.bisect_right(neg_scores, -score) + 1
+                    parts += ("\n", font_manager.style_text(f"Your score ranks #{rank} on the leaderboard!", "info"), "\n")
+        
+        font_manager.render_frame(*parts)
         
     def get_player_name(self):
         """
@@ -210,7 +249,7 @@ class CipherUI:
         Returns:
             str: The player's name
         """
-        print("\n" + font_manager.style_text("You achieved a high score!", "success"))
+        font_manager.render_frame("\n", font_manager.style_text("You achieved a high score!", "success"), "\n")
         name_prompt = font_manager.format_input_prompt("Enter your name: ")
         name = input(name_prompt).strip()
         return name if name else "Anonymous"
@@ -0,0 +1,15 @@
+"""
+Pytest configuration for the Cipher Clash tests.
+"""
+import os
+import sys
+import pathlib
+
+# Add the repository root to sys.path once per session
+parent_dir = str(pathlib.Path(__file__).resolve().parents[4])
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+# The audio module initializes the mixer on import, so give SDL a dummy
+# driver on machines without a sound device
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
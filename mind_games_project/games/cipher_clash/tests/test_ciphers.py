@@ -2,23 +2,24 @@
 Unit tests for cipher algorithms.
 """
 import unittest
-import sys
-import os
-
-# Add the parent directory to sys.path
-parent_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-if parent_dir not in sys.path:
-    sys.path.append(parent_dir)
 
 from mind_games_project.games.cipher_clash.game_engine.cipher_manager import CipherManager
+from mind_games_project.games.cipher_clash.modules.encryption import (
+    generate_plaintext, MAX_WORD_LENGTH, caesar_cipher, transposition_cipher,
+    vigenere_cipher, vigenere_decrypt
+)
+from mind_games_project.games.cipher_clash.modules.playfair import (
+    playfair_encrypt, playfair_decrypt, prepare_text_for_playfair
+)
 
 class TestCipherManager(unittest.TestCase):
     """Test cases for the CipherManager class."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.cipher_manager = CipherManager()
-        self.test_text = "HELLO WORLD"
+    @classmethod
+    def setUpClass(cls):
+        """Set up shared test fixtures."""
+        cls.cipher_manager = CipherManager()
+        cls.test_text = "HELLO WORLD"
     
     def test_caesar_cipher(self):
         """Test Caesar cipher encryption and decryption."""
@@ -77,21 +78,136 @@ class TestCipherManager(unittest.TestCase):
     def test_encrypt_decrypt_workflow(self):
         """Test the full encrypt/decrypt workflow for all cipher types."""
         for cipher_type in self.cipher_manager.cipher_types:
-            # Encrypt
-            encrypted, key, hint = self.cipher_manager.encrypt(self.test_text, cipher_type)
-            
-            # Decrypt
-            if cipher_type == "morse":
-                # Morse code doesn't use a key
-                decrypted = self.cipher_manager.decrypt(encrypted, cipher_type)
-                self.assertEqual(decrypted.replace(" ", ""), self.test_text.replace(" ", ""))
-            else:
-                # Other ciphers use a key
-                decrypted = self.cipher_manager.decrypt(encrypted, cipher_type, key=key)
-                self.assertEqual(decrypted.strip(), self.test_text.strip())
-            
-            # Check that hint is provided
-            self.assertIsNotNone(hint)
+            with self.subTest(cipher_type=cipher_type):
+                # Encrypt
+                encrypted, key, hint = self.cipher_manager.encrypt(self.test_text, cipher_type)
+                
+                # Decrypt
+                if cipher_type == "morse":
+                    # Morse code doesn't use a key
+                    decrypted = self.cipher_manager.decrypt(encrypted, cipher_type)
+                    self.assertEqual(decrypted.replace(" ", ""), self.test_text.replace(" ", ""))
+                else:
+                    # Other ciphers use a key
+                    decrypted = self.cipher_manager.decrypt(encrypted, cipher_type, key=key)
+                    self.assertEqual(decrypted.strip(), self.test_text.strip())
+                
+                # Check that hint is provided
+                self.assertIsNotNone(hint)
+
+class TestEncryptionKernels(unittest.TestCase):
+    """Test cases for the encryption module's cipher functions."""
+    
+    def test_caesar_cipher(self):
+        """Test Caesar shifts against known vectors."""
+        self.assertEqual(caesar_cipher("Hello, World!", 3), "Khoor, Zruog!")
+        self.assertEqual(caesar_cipher("Khoor, Zruog!", 23), "Hello, World!")
+        self.assertEqual(caesar_cipher("xyz XYZ", 29), "abc ABC")
+        self.assertEqual(caesar_cipher("abc", 26), "abc")
+        self.assertEqual(caesar_cipher("", 5), "")
+        
+        # Only ASCII letters are shifted
+        self.assertEqual(caesar_cipher("Héllo ß", 3), "Kéoor ß")
+    
+    def test_vigenere_cipher(self):
+        """Test Vigenère encryption and decryption against known vectors."""
+        cases = [
+            ("ATTACK AT DAWN", "LEMON", "LXFOPV EF RNHR"),
+            ("attack at dawn", "lemon", "lxfopv ef rnhr"),
+            # Non-ASCII letters pass through and do not advance the key
+            ("Até à bientôt", "KEY", "Kxé à zsildôx"),
+            ("", "KEY", ""),
+        ]
+        for text, key, expected in cases:
+            with self.subTest(text=text, key=key):
+                self.assertEqual(vigenere_cipher(text, key), expected)
+                self.assertEqual(vigenere_decrypt(expected, key), text)
+    
+    def test_transposition_cipher(self):
+        """Test columnar transposition against known vectors."""
+        cases = [
+            ("ABCDEF", 3, "ADBECF"),
+            ("HELLO WORLD", 3, "HLODEOR LWL "),
+            # Lengths that are not a multiple of the column count are padded
+            ("ABCDEFG", 3, "ADGBE CF "),
+            ("AB", 5, "AB   "),
+            ("ÉCOLE", 2, "ÉOECL "),
+            ("", 4, ""),
+        ]
+        for text, num_columns, expected in cases:
+            with self.subTest(text=text, num_columns=num_columns):
+                self.assertEqual(transposition_cipher(text, num_columns), expected)
+
+class TestPlayfair(unittest.TestCase):
+    """Test cases for the Playfair cipher."""
+    
+    KEY = "playfair example"
+    PLAIN_TEXT = "Hide the gold in the tree stump"
+    CIPHER_TEXT = "BMODZBXDNABEKUDMUIXMMOUVIF"
+    
+    def test_prepare_text(self):
+        """Test cleaning text and splitting it into digraphs."""
+        cases = [
+            # Repeated letters get an 'X' between them
+            ("balloon", [("B", "A"), ("L", "X"), ("L", "O"), ("O", "N")]),
+            # Odd length gets a padding 'X'
+            ("jam", [("I", "A"), ("M", "X")]),
+            # Non-letters are dropped
+            ("a-b c!d", [("A", "B"), ("C", "D")]),
+            ("Été", [("É", "T"), ("É", "X")]),
+            ("", []),
+        ]
+        for text, expected in cases:
+            with self.subTest(text=text):
+                self.assertEqual(prepare_text_for_playfair(text), expected)
+    
+    def test_encrypt(self):
+        """Test Playfair encryption against known vectors."""
+        self.assertEqual(playfair_encrypt(self.PLAIN_TEXT, self.KEY), self.CIPHER_TEXT)
+        
+        # J is encrypted as I
+        self.assertEqual(playfair_encrypt("jam", "KEY"), playfair_encrypt("iam", "KEY"))
+        
+        # Letters outside the matrix leave their digraph unchanged
+        self.assertEqual(playfair_encrypt("Été", "KEY"), "ÉTÉX")
+    
+    def test_decrypt(self):
+        """Test Playfair decryption against known vectors."""
+        self.assertEqual(playfair_decrypt(self.CIPHER_TEXT, self.KEY),
+                         "HIDETHEGOLDINTHETREXESTUMP")
+        
+        # Lowercase cipher text is looked up like uppercase
+        self.assertEqual(playfair_decrypt("bmod", self.KEY), "HIDE")
+        
+        # An unpaired last character is dropped
+        self.assertEqual(playfair_decrypt("BMODZ", self.KEY), "HIDE")
+        
+        # Digraphs containing non-letters are left unchanged
+        self.assertEqual(playfair_decrypt("BM-OD", self.KEY), "HI-O")
+    
+    def test_round_trip(self):
+        """Test that decryption recovers the prepared text."""
+        for text in ["HELLO WORLD", "Balloon", "Jazz", "ABC", "Été à Paris"]:
+            with self.subTest(text=text):
+                prepared = "".join(a + b for a, b in prepare_text_for_playfair(text))
+                decrypted = playfair_decrypt(playfair_encrypt(text, "SECRET"), "SECRET")
+                # Decryption strips a trailing padding 'X'
+                if prepared.endswith("X"):
+                    prepared = prepared[:-1]
+                self.assertEqual(decrypted, prepared)
+
+class TestGeneratePlaintext(unittest.TestCase):
+    """Test cases for plaintext generation."""
+    
+    def test_reaches_min_length(self):
+        """Test that messages reach min_length when max_length leaves room for it."""
+        for min_length, word_count in [(5, 0), (12, 1), (20, 2), (60, 3)]:
+            max_length = min_length + MAX_WORD_LENGTH + 1
+            with self.subTest(min_length=min_length, word_count=word_count):
+                for _ in range(500):
+                    message = generate_plaintext(min_length, max_length, word_count)
+                    self.assertGreaterEqual(len(message), min_length)
+                    self.assertLessEqual(len(message), max_length)
 
 if __name__ == "__main__":
     unittest.main()
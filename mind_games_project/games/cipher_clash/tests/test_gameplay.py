@@ -2,44 +2,41 @@
 Unit tests for game logic and scoring.
 """
 import unittest
-import sys
-import os
 import time
 
-# Add the parent directory to sys.path
-parent_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-if parent_dir not in sys.path:
-    sys.path.append(parent_dir)
-
 from mind_games_project.games.cipher_clash.game_engine.game_logic import GameState
 from mind_games_project.games.cipher_clash.game_engine.question_generator import QuestionGenerator
+from mind_games_project.games.cipher_clash.game_engine.multiplayer import MultiplayerManager
 
 class TestQuestionGenerator(unittest.TestCase):
     """Test cases for the QuestionGenerator class."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.question_generator = QuestionGenerator()
+    @classmethod
+    def setUpClass(cls):
+        """Set up shared test fixtures."""
+        cls.question_generator = QuestionGenerator()
     
     def test_generate_question(self):
         """Test question generation for different difficulties and cipher types."""
         # Test for each difficulty
         for difficulty in ["easy", "medium", "hard"]:
-            question = self.question_generator.generate_question(difficulty)
-            
-            self.assertIsNotNone(question)
-            self.assertEqual(question["difficulty"], difficulty)
-            self.assertIn(question["cipher_type"], ["caesar", "vigenere", "morse", "substitution", "transposition"])
-            self.assertIsNotNone(question["original_text"])
-            self.assertIsNotNone(question["encrypted_text"])
-            self.assertIsNotNone(question["hint"])
+            with self.subTest(difficulty=difficulty):
+                question = self.question_generator.generate_question(difficulty)
+                
+                self.assertIsNotNone(question)
+                self.assertEqual(question["difficulty"], difficulty)
+                self.assertIn(question["cipher_type"], ["caesar", "vigenere", "morse", "substitution", "transposition"])
+                self.assertIsNotNone(question["original_text"])
+                self.assertIsNotNone(question["encrypted_text"])
+                self.assertIsNotNone(question["hint"])
         
         # Test for specific cipher type
         for cipher_type in ["caesar", "vigenere", "morse", "substitution", "transposition"]:
-            question = self.question_generator.generate_question("medium", cipher_type)
-            
-            self.assertIsNotNone(question)
-            self.assertEqual(question["cipher_type"], cipher_type)
+            with self.subTest(cipher_type=cipher_type):
+                question = self.question_generator.generate_question("medium", cipher_type)
+                
+                self.assertIsNotNone(question)
+                self.assertEqual(question["cipher_type"], cipher_type)
     
     def test_verify_answer(self):
         """Test answer verification."""
@@ -180,6 +177,39 @@ class TestGameState(unittest.TestCase):
         self.assertIn("accuracy", results)
         self.assertIn("time_taken", results)
         self.assertIn("difficulty", results)
+        
+        # Results are frozen once the game is over
+        self.assertIs(self.game_state.get_results(), results)
+
+class TestMultiplayerManager(unittest.TestCase):
+    """Test cases for the MultiplayerManager class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.player1 = GameState()
+        self.player2 = GameState()
+        self.multiplayer = MultiplayerManager()
+        self.multiplayer.start_multiplayer_game(self.player1, self.player2)
+    
+    def test_winner_by_score(self):
+        """Test that the higher score wins."""
+        self.player1.total_score = 150
+        self.player2.total_score = 100
+        self.multiplayer.end_game()
+        self.assertEqual(self.multiplayer.winner, 1)
+    
+    def test_tie_broken_by_accuracy(self):
+        """Test that equal scores fall back to accuracy, then a draw."""
+        self.player1.total_score = self.player2.total_score = 100
+        self.player1.correct_answers, self.player1.questions_answered = 1, 2
+        self.player2.correct_answers, self.player2.questions_answered = 1, 1
+        self.multiplayer.end_game()
+        self.assertEqual(self.multiplayer.winner, 2)
+        
+        self.multiplayer.winner = None
+        self.player1.questions_answered = 1
+        self.multiplayer.end_game()
+        self.assertEqual(self.multiplayer.winner, 0)
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,93 @@
+"""
+Unit tests for audio playback and the sound manager's job scheduler.
+"""
+import unittest
+
+import numpy as np
+from pygame import mixer, sndarray
+
+from mind_games_project.games.cipher_clash.modules.audio import AudioManager
+from mind_games_project.games.cipher_clash.modules.sound_manager import SoundManager
+
+class TestMorsePlayback(unittest.TestCase):
+    """Test cases for AudioManager's Morse code rendering."""
+    
+    def setUp(self):
+        """Set up an audio manager with short silent dot and dash sounds."""
+        self.audio_manager = AudioManager()
+        self.audio_manager.init_audio()
+        
+        frequency, _, channels = mixer.get_init()
+        shape = (frequency // 20,) + ((channels,) if channels > 1 else ())
+        for name in ("morse_dot", "morse_dash"):
+            self.audio_manager.sound_cache[name] = sndarray.make_sound(np.zeros(shape, dtype=np.int16))
+    
+    def tearDown(self):
+        """Stop any Morse code left playing."""
+        self.audio_manager.stop_morse_code()
+    
+    def test_render_morse(self):
+        """Test that text with Morse characters renders to a sound."""
+        rendered = self.audio_manager.render_morse("SOS", 0.01)
+        self.assertIsNotNone(rendered)
+        self.assertGreater(rendered.get_length(), 0)
+    
+    def test_text_without_morse(self):
+        """Test that text with no Morse characters plays nothing."""
+        for text in ["", "!!", "?? ,"]:
+            with self.subTest(text=text):
+                self.assertIsNone(self.audio_manager.render_morse(text, 0.01))
+                self.audio_manager.play_morse_code(text, 0.01)
+                self.audio_manager.start_morse_code_background(text, 0.01)
+                self.assertFalse(self.audio_manager.morse_chan.get_busy())
+
+class TestSoundScheduler(unittest.TestCase):
+    """Test cases for SoundManager's scheduler thread."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.sound_manager = SoundManager()
+        self.fired = []
+    
+    def record(self, name, delays=()):
+        """Make a callback that records its name and returns the next delays."""
+        delays = list(delays)
+        
+        def callback():
+            self.fired.append(name)
+            return delays.pop(0) if delays else None
+        
+        return callback
+    
+    def test_jobs_run_in_deadline_order(self):
+        """Test that jobs fire by deadline, cancelled jobs don't, and the thread stops."""
+        manager = self.sound_manager
+        manager.schedule_job("late", 0.3, self.record("late"))
+        manager.schedule_job("early", 0.05, self.record("early"))
+        manager.schedule_job("cancelled", 0.15, self.record("cancelled"))
+        manager.schedule_job("repeat", 0.1, self.record("repeat", [0.1]))
+        manager.cancel_job("cancelled")
+        
+        thread = manager.scheduler_thread
+        self.assertIsNotNone(thread)
+        thread.join(timeout=2)
+        
+        self.assertFalse(thread.is_alive())
+        self.assertIsNone(manager.scheduler_thread)
+        self.assertEqual(self.fired, ["early", "repeat", "repeat", "late"])
+        self.assertEqual(manager.jobs, {})
+    
+    def test_rescheduling_replaces_job(self):
+        """Test that scheduling under a name in use replaces the old job."""
+        manager = self.sound_manager
+        manager.schedule_job("tick", 0.05, self.record("old"))
+        manager.schedule_job("tick", 0.1, self.record("new"))
+        
+        thread = manager.scheduler_thread
+        thread.join(timeout=2)
+        
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(self.fired, ["new"])
+
+if __name__ == "__main__":
+    unittest.main()